@@ -0,0 +1,378 @@
+# batch.py
+#
+# Copyright 2025-2026 Golodnikov Sergey
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+# headless conversion, important: must not import gi
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from itertools import islice
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+
+from . import convertidor, definitions
+from .convertidor import quantities, conversion, conversion_cache, unit_symbol
+
+
+# defaults, as in the GSettings schema
+PRECISION = 16
+QUANTIZE = 6
+SCIENTIFIC = 10
+
+CHUNK = 2000  # values per task in the parallel and fast modes
+SAMPLE = 16  # values per chunk checked against Decimal in the fast mode
+
+
+def unit_index(quantity: str, unit: str) -> int:
+    units = quantities[quantity]['units']
+
+    if unit.isdigit():
+        if int(unit) < len(units):
+            return int(unit)
+        raise ValueError(f'unit index out of range: {unit}')
+
+    # identifier, full title, symbol
+    names, symbols = units.indexes()
+    i = units.identifiers.get(unit)
+    if i is None:
+        i = names.get(unit.lower())
+    if i is not None:
+        return i
+    found = symbols.get(unit, ())
+    if len(found) == 1:
+        return found[0]
+    if len(found) > 1:
+        titles = ', '.join(f'"{units.titles[i]}"' for i in found)
+        raise ValueError(f'ambiguous unit "{unit}": {titles}')
+
+    raise ValueError(f'unknown unit "{unit}" for quantity "{quantity}"')
+
+
+def parse_value(text: str) -> Decimal | str | None:
+    text = text.replace(',', '.').strip()
+    if text == '':
+        return None
+    try:
+        value = Decimal(text)
+    except ArithmeticError:
+        return text  # hexadecimal numbers and the like
+    if type(value.as_tuple().exponent) is not int:
+        return None  # NaN, Infinity
+    if value < 0:
+        return None  # as in the entries, a value is not negative
+    return value.copy_abs()  # -0 is 0
+
+
+# ------------------------------------------------------------------------------
+
+
+def read_csv(stream, column: str | None, header: bool):
+    reader = csv.reader(stream)
+    index = 0
+    if header:
+        names = next(reader, [])
+        if column is not None:
+            if column in names:
+                index = names.index(column)
+            elif column.isdigit():
+                index = int(column)
+            else:
+                raise ValueError(f'no column "{column}" in the header')
+    elif column is not None:
+        index = int(column)
+    for row in reader:
+        yield row[index] if index < len(row) else ''
+
+
+def read_jsonl(stream, column: str | None):
+    field = column if column is not None else 'value'
+    for line in stream:
+        if line.strip() == '':
+            continue
+        try:
+            value = json.loads(line)
+        except ValueError:
+            yield ''
+            continue
+        if isinstance(value, dict):
+            value = value.get(field, '')
+        yield str(value)
+
+
+def convert_values(values,
+                   quantity: str,
+                   source: int,
+                   targets: list[int],
+                   precision: int = PRECISION,
+                   quantize: int = QUANTIZE,
+                   scientific: int = SCIENTIFIC):
+    for text in values:
+        if quantity == 'numbers':
+            value = text.strip() or None  # digits of any numeral system
+        else:
+            value = parse_value(text)
+        result = None
+        if value is not None:
+            result = conversion(quantity, source, value,
+                                precision, quantize, scientific)
+        if result is None:
+            yield text, None
+        else:
+            yield text, [result[i] for i in targets]
+
+
+def worker_init(cache_size: int, exact: bool):
+    if not definitions.loaded:
+        definitions.load()
+    conversion_cache.resize(cache_size)
+    convertidor.exact_mode = exact
+
+
+def convert_chunk(values: list[str], *args) -> list:
+    return list(convert_values(values, *args))
+
+
+def convert_parallel(values,
+                     quantity: str,
+                     source: int,
+                     targets: list[int],
+                     precision: int = PRECISION,
+                     quantize: int = QUANTIZE,
+                     scientific: int = SCIENTIFIC,
+                     jobs: int = 0,
+                     chunk: int = CHUNK):
+    # each worker process has its own decimal context and matrices,
+    # chunks are yielded in submission order
+    jobs = jobs or os.cpu_count() or 1
+    values = iter(values)
+    args = (quantity, source, targets, precision, quantize, scientific)
+    with ProcessPoolExecutor(jobs,
+                             initializer=worker_init,
+                             initargs=(conversion_cache.size,
+                                       convertidor.exact_mode)) as executor:
+        pending = deque()
+        while True:
+            block = list(islice(values, chunk))
+            if block:
+                pending.append(executor.submit(convert_chunk, block, *args))
+            # bounded number of chunks in flight, constant memory
+            while pending and (len(pending) > jobs * 2 or not block):
+                yield from pending.popleft().result()
+            if not block:
+                break
+
+
+def convert_fast(values,
+                 quantity: str,
+                 source: int,
+                 targets: list[int],
+                 precision: int = PRECISION,
+                 quantize: int = QUANTIZE,
+                 scientific: int = SCIENTIFIC,
+                 chunk: int = CHUNK,
+                 stats: dict | None = None):
+    # float64 arrays, the deviation from Decimal is sampled in each chunk
+    from . import vector
+
+    values = iter(values)
+    while True:
+        block = list(islice(values, chunk))
+        if not block:
+            break
+        numbers = []
+        for text in block:
+            value = parse_value(text)
+            number = float(value) if type(value) is Decimal else math.nan
+            # out of the range of float64, such as 1e400: invalid
+            numbers.append(number if math.isfinite(number) else math.nan)
+        result = vector.conversion_array(quantity, source, numbers, precision)
+        result = result[:, targets]
+        # NaN for an invalid value, inf for an overflow of the product
+        valid = vector.finite_rows(result)
+        if stats is not None:
+            sample = [i for i, ok in enumerate(valid) if ok][:SAMPLE]
+            d = vector.deviation(quantity, source,
+                                 [numbers[i] for i in sample],
+                                 [result[i] for i in sample],
+                                 precision, targets)
+            stats['deviation'] = max(stats.get('deviation', 0.0), d)
+        rows = vector.format_rows(result, precision, quantize, scientific)
+        for text, ok, row in zip(block, valid, rows):
+            yield text, row if ok else None
+
+
+def write_csv(stream, rows, names: list[str], header: bool):
+    writer = csv.writer(stream, lineterminator='\n')
+    if header:
+        writer.writerow(['value'] + names)
+    for text, result in rows:
+        writer.writerow([text] + (result or [''] * len(names)))
+        yield result is not None
+
+
+def write_jsonl(stream, rows, names: list[str]):
+    for text, result in rows:
+        record = {'value': text}
+        if result is None:
+            record['error'] = 'invalid value'
+        else:
+            record.update(zip(names, result))
+        stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        yield result is not None
+
+
+# ------------------------------------------------------------------------------
+
+
+def arguments(argv: list[str]):
+    parser = argparse.ArgumentParser(
+        prog='convertidor --batch',
+        description='Convert a stream of values without the user interface.',
+    )
+    parser.add_argument('quantity', choices=list(quantities))
+    parser.add_argument('-f', '--from', dest='source', required=True,
+                        help='source unit: symbol, title or index')
+    parser.add_argument('-t', '--to', dest='targets', action='append',
+                        help='target unit, repeatable (default: all units)')
+    parser.add_argument('-i', '--input', default='-',
+                        help='input file (default: stdin)')
+    parser.add_argument('-o', '--output', default='-',
+                        help='output file (default: stdout)')
+    parser.add_argument('--input-format', choices=('csv', 'jsonl'))
+    parser.add_argument('--output-format', choices=('csv', 'jsonl'))
+    parser.add_argument('-c', '--column',
+                        help='CSV column name or index, JSONL field name')
+    parser.add_argument('--no-header', action='store_true',
+                        help='CSV input and output have no header row')
+    parser.add_argument('-j', '--jobs', type=jobs_count, default=1,
+                        help='worker processes, 0 for all cores (default: 1)')
+    parser.add_argument('--fast', action='store_true',
+                        help='float64 arithmetic (NumPy), precision <= 15')
+    parser.add_argument('--exact', action='store_true',
+                        help='exact ratios of the units, rounded once')
+    parser.add_argument('--cache-size', type=int,
+                        default=conversion_cache.size,
+                        help='results of repeated values to keep, 0 disables')
+    parser.add_argument('--precision', type=int, default=PRECISION)
+    parser.add_argument('--quantize', type=int, default=QUANTIZE)
+    parser.add_argument('--scientific', type=int, default=SCIENTIFIC)
+    return parser, parser.parse_args(argv)
+
+
+def jobs_count(text: str) -> int:
+    jobs = int(text)  # ValueError: reported by argparse
+    if jobs < 0:
+        raise argparse.ArgumentTypeError('must be 1 or more, or 0 for all '
+                                         'cores')
+    return jobs
+
+
+def file_format(path: str, fmt: str | None) -> str:
+    if fmt is not None:
+        return fmt
+    return 'jsonl' if path.endswith(('.jsonl', '.json')) else 'csv'
+
+
+def main(argv: list[str]) -> int:
+    for error in definitions.load():  # before the quantities are listed
+        print('Warning: ' + error, file=sys.stderr)
+    parser, args = arguments(argv)
+    units = quantities[args.quantity]['units']
+
+    try:
+        source = unit_index(args.quantity, args.source)
+        if args.targets:
+            targets = [unit_index(args.quantity, t) for t in args.targets]
+        else:
+            targets = list(range(len(units)))
+    except ValueError as err:
+        parser.error(str(err))
+
+    if args.fast:
+        from . import vector
+        if not vector.available():
+            parser.error('--fast requires NumPy')
+        if not vector.supported(args.quantity, args.precision):
+            parser.error('--fast supports linear quantities with '
+                         f'precision <= {vector.MAX_PRECISION}')
+        if args.exact:
+            parser.error('--fast and --exact can not be combined')
+        if args.jobs != 1:
+            parser.error('--fast and --jobs can not be combined')
+
+    conversion_cache.resize(args.cache_size)
+    convertidor.exact_mode = args.exact
+
+    names = [unit_symbol(units.titles[i]) for i in targets]
+    input_format = file_format(args.input, args.input_format)
+    output_format = file_format(args.output, args.output_format)
+    header = not args.no_header
+
+    src = sys.stdin
+    dst = sys.stdout
+    errors = 0
+    stats = {}
+    try:
+        if args.input != '-':
+            src = open(args.input, newline='', encoding='utf-8')
+        if args.output != '-':
+            dst = open(args.output, 'w', newline='', encoding='utf-8')
+        if input_format == 'csv':
+            values = read_csv(src, args.column, header)
+        else:
+            values = read_jsonl(src, args.column)
+        if args.fast:
+            rows = convert_fast(values, args.quantity, source, targets,
+                                args.precision, args.quantize,
+                                args.scientific, stats=stats)
+        elif args.jobs == 1:
+            rows = convert_values(values, args.quantity, source, targets,
+                                  args.precision, args.quantize,
+                                  args.scientific)
+        else:
+            rows = convert_parallel(values, args.quantity, source, targets,
+                                    args.precision, args.quantize,
+                                    args.scientific, args.jobs)
+        if output_format == 'csv':
+            written = write_csv(dst, rows, names, header)
+        else:
+            written = write_jsonl(dst, rows, names)
+        for line, ok in enumerate(written, 1):
+            if not ok:
+                errors += 1
+                print(f'Error: invalid value, record {line}', file=sys.stderr)
+    except (OSError, ValueError) as err:
+        print('Error: ' + str(err), file=sys.stderr)
+        return 2
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+
+    if 'deviation' in stats:
+        print(f'Maximum relative deviation: {stats["deviation"]:.3e}',
+              file=sys.stderr)
+
+    return 1 if errors else 0
@@ -0,0 +1,338 @@
+# benchmark.py
+#
+# Copyright 2025-2026 Golodnikov Sergey
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+# conversion engine benchmarks, important: must not import gi
+
+from decimal import Decimal, getcontext
+import argparse
+import decimal
+import gc
+import json
+import platform
+import random
+import sys
+import time
+
+from . import convertidor
+from .convertidor import (
+    quantities,
+    conversion,
+    conversion_cache,
+    find_temperature,
+    convert_numbers,
+    convert_fuel,
+    convert_wave,
+    value_processing,
+    quantum,
+    convert,
+    SPECIAL,
+)
+from .expression import ExpressionError, Tokenizer, scan, unit_symbols
+from .radix import BASE64, DIGITS, base_of
+
+
+PRECISIONS = (16, 28, 50, 100)
+VERIFY_PRECISIONS = (500, 1000)  # long values take the adaptive precision
+MAGNITUDES = ('1E-6', '1', '1E+6', '1E+18')
+QUANTIZE = 6
+SCIENTIFIC = 10
+
+SEED = 1990
+VALUES = 32  # per magnitude
+REPEAT = 5
+THRESHOLD = 0.25  # relative slowdown reported as a regression
+
+# convert_numbers with integers of this many digits, --numbers
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+SYSTEMS = ('decimal', 'hexadecimal', 'base36', 'base64')
+
+
+def inputs(magnitude: str, count: int = VALUES) -> list[Decimal]:
+    # the same values on every run
+    rnd = random.Random(f'{SEED}{magnitude}')
+    scale = Decimal(magnitude)
+    return [Decimal(f'{rnd.uniform(1, 10):.6f}') * scale for _ in range(count)]
+
+
+def number_text(identifier: str, size: int) -> str:
+    base = base_of(identifier)
+    alphabet = BASE64 if base == 64 else DIGITS[:base]
+    rnd = random.Random(f'{SEED}{identifier}{size}')
+    return alphabet[1] + ''.join(rnd.choice(alphabet) for _ in range(size - 1))
+
+
+def measure(function,
+            arguments: list[tuple],
+            repeat: int,
+            warm_up: bool = True) -> dict:
+    timer = time.perf_counter_ns
+    samples = []
+    for args in arguments if warm_up else ():
+        function(*args)  # warm up: registry, matrices, caches of the CPU
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for args in arguments:
+                t = timer()
+                function(*args)
+                samples.append(timer() - t)
+    finally:
+        gc.enable()
+    samples.sort()
+    total = sum(samples)
+    return {
+        'calls': len(samples),
+        'p50': samples[len(samples) // 2] / 1000,
+        'p95': samples[int(len(samples) * 0.95)] / 1000,
+        'ops': len(samples) / (total / 1e9) if total else 0.0,
+    }
+
+
+def cases(precisions, magnitudes):
+    # name, function, arguments, precision (None: set by the function)
+    for magnitude in magnitudes:
+        values = inputs(magnitude)
+        integers = [v.to_integral_value() for v in values]
+
+        for p in precisions:
+            for q in quantities:
+                if q == 'numbers':
+                    continue
+                arguments = [(q, 0, v, p, QUANTIZE, SCIENTIFIC)
+                             for v in values]
+                yield f'conversion/{q}/p{p}/{magnitude}', \
+                    conversion, arguments, None
+
+            yield f'find_temperature/p{p}/{magnitude}', find_temperature, \
+                [('celsius', v) for v in values], p
+            yield f'convert_fuel/p{p}/{magnitude}', convert_fuel, \
+                [('km/L', v, quantum(QUANTIZE), SCIENTIFIC)
+                 for v in values], p
+            yield f'convert_wave/p{p}/{magnitude}', convert_wave, \
+                [(6, v, quantum(QUANTIZE), SCIENTIFIC) for v in values], p
+            yield f'value_processing/p{p}/{magnitude}', value_processing, \
+                [(v, quantum(QUANTIZE), SCIENTIFIC) for v in values], p
+
+        yield f'convert_numbers/{magnitude}', convert_numbers, \
+            [('decimal', v) for v in integers], None
+
+
+def number_cases(sizes):
+    # one large value per case, every numeral system is produced
+    for size in sizes:
+        for identifier in SYSTEMS:
+            yield f'convert_numbers/{identifier}/{size}', convert_numbers, \
+                [(identifier, number_text(identifier, size))], None
+
+
+def run(precisions=PRECISIONS,
+        magnitudes=MAGNITUDES,
+        repeat: int = REPEAT,
+        pattern: str = '',
+        sizes=()) -> dict:
+    results = {}
+    size = conversion_cache.size
+    conversion_cache.resize(0)  # every call does the work
+    if sizes:
+        selected = number_cases(sizes)
+    else:
+        selected = cases(precisions, magnitudes)
+    try:
+        for name, function, arguments, precision in selected:
+            if pattern not in name:
+                continue
+            if precision is not None:
+                getcontext().prec = precision
+            results[name] = measure(function, arguments, repeat,
+                                    warm_up=not sizes)
+    finally:
+        conversion_cache.resize(size)
+    return results
+
+
+def long_inputs(precision: int, count: int = VALUES) -> list[Decimal]:
+    # values with as many digits as the precision, such as 1/3
+    rnd = random.Random(f'{SEED}long{precision}')
+    return [Decimal(f'{rnd.randrange(10 ** (precision - 1), 10 ** precision)}'
+                    f'E{rnd.randint(-precision - 6, 6)}')
+            for _ in range(count)]
+
+
+def verify(precisions=VERIFY_PRECISIONS, quantize=(0, QUANTIZE, 20)) -> int:
+    # adaptive precision against the full precision, the number of
+    # strings that differ
+    mismatches = 0
+    adaptive = convertidor.adaptive_precision
+    try:
+        for p in precisions:
+            values = long_inputs(p, 8)
+            for q in quantities:
+                if q in SPECIAL:
+                    continue
+                for index in range(len(quantities[q]['units'])):
+                    for z in quantize:
+                        for v in values:
+                            results = []
+                            for mode in (False, True):
+                                convertidor.adaptive_precision = mode
+                                results.append(convert(q, index, v, p, z,
+                                                       SCIENTIFIC))
+                            if results[0] != results[1]:
+                                mismatches += 1
+                                print(f'Mismatch: {q}/{index}/p{p}/q{z}: '
+                                      f'{v}', file=sys.stderr)
+    finally:
+        convertidor.adaptive_precision = adaptive
+    return mismatches
+
+
+def verify_tokenizer(edits: int = 20000) -> int:
+    # the tokens reused while typing against a fresh scan of the same
+    # text, after random edits; the number of texts that differ
+    rnd = random.Random(f'{SEED}tokens')
+    mismatches = 0
+    for q in ('energy', 'length', 'pressure'):
+        symbols = unit_symbols(q)
+        pieces = (list('0123456789eE.+-*/^() ') + list('1225eeee') +
+                  [s for s, _ in symbols[:40]])
+        tokenizer = Tokenizer()
+        text = ''
+        for _ in range(edits):
+            # mostly typing and correcting at the end, as in an entry
+            i = rnd.choice((len(text), len(text), rnd.randint(0, len(text))))
+            j = max(i - 1, 0)
+            match rnd.randrange(3):
+                case 0:
+                    text = text[:i] + rnd.choice(pieces) + text[i:]
+                case 1:
+                    text = text[:j] + text[i:]
+                case 2:
+                    text = text[:j] + rnd.choice(pieces) + text[i:]
+            if len(text) > 30:
+                text = ''
+            results = []
+            for tokenize in (lambda: tokenizer.tokenize(text, q, symbols),
+                             lambda: scan(text, 0, symbols, None)):
+                try:
+                    results.append(list(tokenize()))
+                except ExpressionError as err:
+                    results.append(str(err))
+            if results[0] != results[1]:
+                mismatches += 1
+                print(f'Mismatch: tokens of {q}: {text!r}', file=sys.stderr)
+    return mismatches
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None or not previous['p50']:
+            continue
+        ratio = current['p50'] / previous['p50']
+        current['ratio'] = ratio
+        if ratio > 1 + threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def environment() -> dict:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'libmpdec': getattr(decimal, '__libmpdec_version__', None),
+        'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
+
+def report(results: dict, stream=sys.stdout):
+    width = max((len(n) for n in results), default=0)
+    print(f'{"benchmark":{width}}  {"p50, us":>10}  {"p95, us":>10}  '
+          f'{"calls/s":>10}  {"vs base":>8}', file=stream)
+    for name, r in results.items():
+        ratio = f'{r["ratio"]:.2f}x' if 'ratio' in r else ''
+        print(f'{name:{width}}  {r["p50"]:10.2f}  {r["p95"]:10.2f}  '
+              f'{r["ops"]:10.0f}  {ratio:>8}', file=stream)
+
+
+# ------------------------------------------------------------------------------
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog='convertidor --benchmark',
+        description='Benchmark the conversion engine.',
+    )
+    parser.add_argument('-k', '--filter', default='',
+                        help='only benchmarks whose name contains this text')
+    parser.add_argument('-p', '--precision', type=int, action='append',
+                        help='precision, repeatable (default: 16 28 50 100)')
+    parser.add_argument('-r', '--repeat', type=int, default=REPEAT)
+    parser.add_argument('--numbers', action='store_true',
+                        help='numeral systems of integers with 1 000 to '
+                             '1 000 000 digits')
+    parser.add_argument('--exact', action='store_true',
+                        help='exact ratios of the units, to compare with a '
+                             'baseline of the Decimal ratios')
+    parser.add_argument('--verify', action='store_true',
+                        help='compare the adaptive precision with the full '
+                             'precision, and the incremental tokenizer with '
+                             'a fresh scan, instead')
+    parser.add_argument('--save', metavar='FILE',
+                        help='save the results as a JSON baseline')
+    parser.add_argument('--baseline', metavar='FILE',
+                        help='compare with a saved baseline')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='p50 slowdown reported as a regression '
+                             f'(default: {THRESHOLD})')
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        mismatches = verify(tuple(args.precision or VERIFY_PRECISIONS))
+        mismatches += verify_tokenizer()
+        print(f'{mismatches} mismatches')
+        return 1 if mismatches else 0
+
+    convertidor.exact_mode = args.exact
+    results = run(tuple(args.precision or PRECISIONS),
+                  MAGNITUDES,
+                  args.repeat,
+                  args.filter,
+                  SIZES if args.numbers else ())
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+
+    report(results)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'environment': environment(), 'results': results},
+                      f, indent=1)
+
+    for name, ratio in regressions:
+        print(f'Regression: {name} is {ratio:.2f}x slower', file=sys.stderr)
+
+    return 1 if regressions else 0
@@ -21,74 +21,81 @@
 # helped begin implementing frequency/wavelength conversion
 
 
-from decimal import Decimal, getcontext
-from gettext import gettext as _
+from collections import OrderedDict
+from collections.abc import Mapping
+from decimal import Context, Decimal, getcontext, localcontext
+import re
+
+
+def N_(message: str) -> str:
+    # marks a string for translation, translated when displayed
+    return message
 
 
 constants = {
     # energy
-    'Wh': _(
+    'Wh': N_(
         '<b>Watt-hour (SI)</b>\n'
         '1 Wh = 3600 J (exact)'
     ),
-    'eV': _(
+    'eV': N_(
         '<b>2022 CODATA Value (SI 2019)</b>\n'
         '1 eV = 1.602176634x10−19 J'
     ),
-    'erg': _(
+    'erg': N_(
         '<b>Erg</b>\n'
         '1 erg = 1E-7 J (exact, CGS unit)'
     ),
-    'cal (th)': _(
+    'cal (th)': N_(
         '<b>Thermochemical calorie</b>\n'
         '1 cal (th) = 4.184 J (exact)'
     ),
-    'cal (it)': _(
+    'cal (it)': N_(
         '<b>International Table calorie (IT)</b>\n'
         '1 cal (it) = 4.1868 J (exact)'
     ),
-    'ft-pdl': _(
+    'ft-pdl': N_(
         '<b>Foot-poundal</b>\n'
         '1 ft-pdl = 0.0421401100938048 J (exact)'
     ),
-    'ft⋅lbf': _(
+    'ft⋅lbf': N_(
         '<b>Foot-pound force (ft⋅lbf)</b>\n'
         '1 ft⋅lbf = 1.3558179483314004 J (exact)'
     ),
-    'Btu (th)': _(
+    'Btu (th)': N_(
         '<b>British thermal unit (thermochemical)</b>\n'
         '1 Btu (th) = 1054.3502644383 J'
     ),
-    'Btu (it)': _(
+    'Btu (it)': N_(
         '<b>British thermal unit (International Table, IT)</b>\n'
         '1 Btu (it) = 1055.05585262 J'
     ),
-    'thm (US)': _(
+    'thm (US)': N_(
         '<b>Therm (United States)</b>\n'
         '1 thm (US) = 100 000 Btu (it) = 105 480 400 J'
     ),
-    'thm (EC)': _(
+    'thm (EC)': N_(
         '<b>Therm (European Community)</b>\n'
         '1 thm (US) = 100 000 Btu (th) ≈ 105 505 585.257 J'
     ),
     # length
-    'ls': _(
+    'ls': N_(
         '<b>The distance light travels in 1 second</b>\n'
         '1 light-second (ls) = 299 792 458 m'
     ),
-    'lmn': _(
+    'lmn': N_(
         'Based on 1/12 of a Julian year (365.25 days)'
     ),
-    'ly': _(
+    'ly': N_(
         'Julian year, 365.25 days'
     ),
     # wave
-    'RPM': _(
+    'RPM': N_(
         '<b>1 RPM = 1/60 Hz</b>\n'
         'Used to measure the rotational speed of mechanical parts,\n'
         'such as an engine crankshaft, a disk, or a fan.'
     ),
-    'BPM': _(
+    'BPM': N_(
         '<b>1 BPM = 1/60 Hz</b>\n'
         'Used to determine the tempo in music or the heart\n'
         'rate (pulse) in medicine.'
@@ -113,582 +120,818 @@ constants = {
 # volume
 # wave
 
-# units: (title, decimal, pattern, ![minor]derived, ![minor]constant)
+# units: (title, decimal, pattern, ![minor]derived, ![minor]constant),
+# turned into parallel arrays by Registry, see Units
+
+
+class Registry(Mapping):
+    # quantities are built on first access and cached
+
+    PRECISION = 50  # for the ratios computed while building
+
+    def __init__(self, builders: dict):
+        self.builders = builders  # key: (title, builder)
+        self.icons = {}  # key: icon name, of the quantities added
+        self.extensions = {}  # key: builder of the units appended
+        self.built = {}
+
+    def __getitem__(self, key: str) -> dict:
+        quantity = self.built.get(key)
+        if quantity is None:
+            title, builder = self.builders[key]
+            with localcontext(Context(prec=self.PRECISION)):
+                quantity = builder()
+                extension = self.extensions.get(key)
+                if extension is not None:
+                    pattern, units = extension()
+                    quantity['pattern'] = tuple(quantity['pattern']) + pattern
+                    quantity['units'] = tuple(quantity['units']) + units
+            quantity['title'] = title
+            quantity['units'] = Units(quantity['units'])
+            self.built[key] = quantity
+        return quantity
+
+    def __contains__(self, key) -> bool:
+        return key in self.builders
+
+    def __iter__(self):
+        return iter(self.builders)
+
+    def __len__(self) -> int:
+        return len(self.builders)
+
+    def title(self, key: str) -> str:
+        return self.builders[key][0]
+
+    def icon(self, key: str) -> str:
+        return self.icons.get(key, 'q-' + key + '-symbolic')
+
+    # user and site definitions, see definitions.py, before the first
+    # conversion: the matrices and the indexes are not rebuilt
+
+    def add(self, key: str, title: str, builder, icon: str):
+        self.builders[key] = (title, builder)
+        self.icons[key] = icon
+
+    def extend(self, key: str, builder):
+        # builder: (pattern, units) appended to those of the quantity
+        self.extensions[key] = builder
+        self.built.pop(key, None)
+
+
+def unit_symbol(title: str) -> str:
+    return title.rsplit(', ', 1)[-1]
+
+
+class Units:
+    # the units of a quantity as parallel arrays, the tuples of the
+    # builders are dropped once this is made
+
+    __slots__ = (
+        'titles',
+        'values',  # Decimal ratio or identifier
+        'sections',  # index of the pattern
+        'derived',
+        'hints',
+        'identifiers',  # identifier: index
+        'names',  # lower case title: index, see indexes()
+        'symbols',  # symbol: (index, ...), see indexes()
+    )
+
+    def __init__(self, units: tuple):
+        self.titles = tuple(u[0] for u in units)
+        self.values = tuple(u[1] for u in units)
+        self.sections = bytes(u[2] for u in units)
+        self.derived = tuple(len(u) > 3 and bool(u[3]) for u in units)
+        self.hints = tuple(u[4] if len(u) > 4 else '' for u in units)
+
+        self.identifiers = {v: i for i, v in enumerate(self.values)
+                            if type(v) is str}
+        self.names = None
+        self.symbols = None
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def indexes(self) -> tuple[dict, dict]:
+        # built on the first lookup, the user interface does not need them
+        if self.names is None:
+            names = {}
+            symbols = {}
+            for i, title in enumerate(self.titles):
+                names.setdefault(title.lower(), i)
+                symbols.setdefault(unit_symbol(title), []).append(i)
+            self.symbols = {k: tuple(v) for k, v in symbols.items()}
+            self.names = names
+        return self.names, self.symbols
 
 
 PI = Decimal('3.1415926535897932384626433832795028841971693993751')
 SL = Decimal('299792458')  # speed of light in vacuum
 
 
-quantities = {
+quantities = Registry({
 
-    'angle': {
-        'title': _('Angle'),
+    'angle': (N_('Angle'), lambda: {
         'pattern': (
-            (_('Units of measurement'), ''),
+            (N_('Units of measurement'), ''),
         ),
         'units': (
-            (_('Second, "'), Decimal('1'), 0),
-            (_("Minute, '"), Decimal('60'), 0),
-            (_('Grad, ^g'), Decimal('3240'), 0),
-            (_('Degree, °'), Decimal('3600'), 0),
-            (_('Radian, rad'), Decimal('648000') / PI, 0),
-            (_('Milliradian, mrad'), Decimal('648') / PI, 0),
+            (N_('Second, "'), Decimal('1'), 0),
+            (N_("Minute, '"), Decimal('60'), 0),
+            (N_('Grad, ^g'), Decimal('3240'), 0),
+            (N_('Degree, °'), Decimal('3600'), 0),
+            (N_('Radian, rad'), Decimal('648000') / PI, 0),
+            (N_('Milliradian, mrad'), Decimal('648') / PI, 0),
             #   3600 * 180  = 648000
             # 648000 / 1000 = 648
         ),
-    },
+    }),
 
-    'area': {
-        'title': _('Area'),
+    'area': (N_('Area'), lambda: {
         'pattern': (
-            (_('Metric system'), ''),
-            (_('Imperial and US customary systems'), 'imperial'),
+            (N_('Metric system'), ''),
+            (N_('Imperial and US customary systems'), 'imperial'),
         ),
         'units': (
             # Metric system
-            (_('Square nanometer, nm^2'), Decimal('1'), 0, True),
-            (_('Square micrometer μm^2'), Decimal('1E+6'), 0, True),
-            (_('Square millimeter, mm^2'), Decimal('1E+12'), 0),
-            (_('Square centimeter, cm^2'), Decimal('1E+14'), 0),
-            (_('Square decimeter, dm^2'), Decimal('1E+16'), 0, True),
-            (_('Square meter, m^2'), Decimal('1E+18'), 0),
-            (_('Square dekameter, dam^2'), Decimal('1E+20'), 0, True),
-            (_('Are, a'), Decimal('1E+20'), 0),
-            (_('Square hectometer, hm^2'), Decimal('1E+22'), 0, True),
-            (_('Hectare, ha'), Decimal('1E+22'), 0),
-            (_('Square kilometer, km^2'), Decimal('1E+24'), 0, True),
-            (_('Square astronomical unit, au^2'),
+            (N_('Square nanometer, nm^2'), Decimal('1'), 0, True),
+            (N_('Square micrometer μm^2'), Decimal('1E+6'), 0, True),
+            (N_('Square millimeter, mm^2'), Decimal('1E+12'), 0),
+            (N_('Square centimeter, cm^2'), Decimal('1E+14'), 0),
+            (N_('Square decimeter, dm^2'), Decimal('1E+16'), 0, True),
+            (N_('Square meter, m^2'), Decimal('1E+18'), 0),
+            (N_('Square dekameter, dam^2'), Decimal('1E+20'), 0, True),
+            (N_('Are, a'), Decimal('1E+20'), 0),
+            (N_('Square hectometer, hm^2'), Decimal('1E+22'), 0, True),
+            (N_('Hectare, ha'), Decimal('1E+22'), 0),
+            (N_('Square kilometer, km^2'), Decimal('1E+24'), 0, True),
+            (N_('Square astronomical unit, au^2'),
                 Decimal('2.2379522915281197E+40'), 0),
             # Imperial and US customary systems
-            (_('Square inch, in^2'), Decimal('6.4516E+14'), 1),
-            (_('Square foot, ft^2'), Decimal('92903039999997600'), 1),
-            (_('Square foot (US), ft^2'), Decimal('92903411613275790'), 1),
-            (_('Square yard, yd^2'), Decimal('836127359999986200'), 1),
-            (_('Acre, ac'), Decimal('4.0468564224E+21'), 1),
-            (_('Acre (US), ac'), Decimal('4.0468726099999997E+21'), 1),
-            (_('Square mile, mi^2'), Decimal('2.589988110336E+24'), 1),
-            (_('Square mile (US), mi^2'), Decimal('2.58999847031952E+24'), 1),
+            (N_('Square inch, in^2'), Decimal('6.4516E+14'), 1),
+            (N_('Square foot, ft^2'), Decimal('92903039999997600'), 1),
+            (N_('Square foot (US), ft^2'), Decimal('92903411613275790'), 1),
+            (N_('Square yard, yd^2'), Decimal('836127359999986200'), 1),
+            (N_('Acre, ac'), Decimal('4.0468564224E+21'), 1),
+            (N_('Acre (US), ac'), Decimal('4.0468726099999997E+21'), 1),
+            (N_('Square mile, mi^2'), Decimal('2.589988110336E+24'), 1),
+            (N_('Square mile (US), mi^2'), Decimal('2.58999847031952E+24'), 1),
         ),
-    },
+    }),
 
-    'digital': {
-        'title': _('Digital data'),
+    'digital': (N_('Digital data'), lambda: {
         'pattern': (
-            (_('Data transfer rates'), ''),
-            (_('Size of files and data'), ''),
-            (_('Binary contexts'), ''),
+            (N_('Data transfer rates'), ''),
+            (N_('Size of files and data'), ''),
+            (N_('Binary contexts'), ''),
         ),
         'units': (
             # Data transfer rates
-            (_('Bit, b'), Decimal('1'), 0),
-            (_('Kilobit, Kb'), Decimal('1E+3'), 0),
-            (_('Megabit, Mb'), Decimal('1E+6'), 0),
-            (_('Gigabit, Gb'), Decimal('1E+9'), 0),
-            (_('Terabit, Tb'), Decimal('1E+12'), 0),
-            (_('Petabit, Pb'), Decimal('1E+15'), 0, True),
-            (_('Exabit, Eb'), Decimal('1E+18'), 0, True),
+            (N_('Bit, b'), Decimal('1'), 0),
+            (N_('Kilobit, Kb'), Decimal('1E+3'), 0),
+            (N_('Megabit, Mb'), Decimal('1E+6'), 0),
+            (N_('Gigabit, Gb'), Decimal('1E+9'), 0),
+            (N_('Terabit, Tb'), Decimal('1E+12'), 0),
+            (N_('Petabit, Pb'), Decimal('1E+15'), 0, True),
+            (N_('Exabit, Eb'), Decimal('1E+18'), 0, True),
             # Size of files and data
-            (_('Byte, B'), Decimal('8'), 1),
-            (_('Kilobyte, KB'), Decimal('8E+3'), 1),
-            (_('Megabyte, MB'), Decimal('8E+6'), 1),
-            (_('Gigabyte, GB'), Decimal('8E+9'), 1),
-            (_('Terabyte, TB'), Decimal('8E+12'), 1),
-            (_('Petabyte, PB'), Decimal('8E+15'), 1, True),
-            (_('Exabyte, EB'), Decimal('8E+18'), 1, True),
+            (N_('Byte, B'), Decimal('8'), 1),
+            (N_('Kilobyte, KB'), Decimal('8E+3'), 1),
+            (N_('Megabyte, MB'), Decimal('8E+6'), 1),
+            (N_('Gigabyte, GB'), Decimal('8E+9'), 1),
+            (N_('Terabyte, TB'), Decimal('8E+12'), 1),
+            (N_('Petabyte, PB'), Decimal('8E+15'), 1, True),
+            (N_('Exabyte, EB'), Decimal('8E+18'), 1, True),
             # Binary contexts
-            (_('Kibibyte, KiB'), Decimal('8192'), 2),
-            (_('Mebibyte, MiB'), Decimal('8388608'), 2),
-            (_('Gibibyte, GiB'), Decimal('8589934592'), 2),
-            (_('Tebibyte, TiB'), Decimal('8796093022208'), 2),
-            (_('Pebibyte, PiB'), Decimal('9007199254740992'), 2, True),
-            (_('Exbibyte, EiB'), Decimal('9223372036854775808'), 2, True),
+            (N_('Kibibyte, KiB'), Decimal('8192'), 2),
+            (N_('Mebibyte, MiB'), Decimal('8388608'), 2),
+            (N_('Gibibyte, GiB'), Decimal('8589934592'), 2),
+            (N_('Tebibyte, TiB'), Decimal('8796093022208'), 2),
+            (N_('Pebibyte, PiB'), Decimal('9007199254740992'), 2, True),
+            (N_('Exbibyte, EiB'), Decimal('9223372036854775808'), 2, True),
         )
-    },
+    }),
 
     # attention: the base unit is the Joule
-    'energy': {
-        'title': _('Energy'),
+    'energy': (N_('Energy'), lambda: {
         'pattern': (
-            (_('Joule units'), ''),
-            (_('Electrical energy'), ''),
-            (_('Other energy units'), ''),
-            (_('Imperial and US customary systems'), 'imperial'),
+            (N_('Joule units'), ''),
+            (N_('Electrical energy'), ''),
+            (N_('Other energy units'), ''),
+            (N_('Imperial and US customary systems'), 'imperial'),
         ),
         'units': (
             # Joule units
-            (_('Attojoule, aJ'), Decimal('1E-18'), 0, True),
-            (_('Nanojoule, nJ'), Decimal('1E-9'), 0, True),
-            (_('Microjoule, μJ'), Decimal('1E-6'), 0, True),
-            (_('Millijoule, mJ'), Decimal('1E-3'), 0, True),
-            (_('Joule, J'), Decimal('1'), 0),  # base unit
-            (_('Kilojoule, kJ'), Decimal('1E+3'), 0),
-            (_('Megajoule, MJ'), Decimal('1E+6'), 0),
-            (_('Gigajoule, GJ'), Decimal('1E+9'), 0, True),
-            (_('Terajoule, TJ'), Decimal('1E+12'), 0, True),
+            (N_('Attojoule, aJ'), Decimal('1E-18'), 0, True),
+            (N_('Nanojoule, nJ'), Decimal('1E-9'), 0, True),
+            (N_('Microjoule, μJ'), Decimal('1E-6'), 0, True),
+            (N_('Millijoule, mJ'), Decimal('1E-3'), 0, True),
+            (N_('Joule, J'), Decimal('1'), 0),  # base unit
+            (N_('Kilojoule, kJ'), Decimal('1E+3'), 0),
+            (N_('Megajoule, MJ'), Decimal('1E+6'), 0),
+            (N_('Gigajoule, GJ'), Decimal('1E+9'), 0, True),
+            (N_('Terajoule, TJ'), Decimal('1E+12'), 0, True),
             # Electrical energy
-            (_('Watt-hour, Wh'),
+            (N_('Watt-hour, Wh'),
                 Decimal('3.6E+3'), 1, False, constants['Wh']),
-            (_('Kilowatt-hour, kWh'), Decimal('3.6E+6'), 1),
-            (_('Megawatt-hour, MWh'), Decimal('3.6E+9'), 1),
-            (_('Gigawatt-hour, GWh'), Decimal('3.6E+12'), 1, True),
+            (N_('Kilowatt-hour, kWh'), Decimal('3.6E+6'), 1),
+            (N_('Megawatt-hour, MWh'), Decimal('3.6E+9'), 1),
+            (N_('Gigawatt-hour, GWh'), Decimal('3.6E+12'), 1, True),
             # Other energy units
-            (_('Electronvolt, eV'),
+            (N_('Electronvolt, eV'),
                 Decimal('1.602176634E-19'), 2, False, constants['eV']),
-            (_('Erg, erg'), Decimal('1E-7'), 2, False, constants['erg']),
-            (_('Calorie (th), cal'),
+            (N_('Erg, erg'), Decimal('1E-7'), 2, False, constants['erg']),
+            (N_('Calorie (th), cal'),
                 Decimal('4.184'), 2, False, constants['cal (th)']),
-            (_('Calorie (it), cal'),
+            (N_('Calorie (it), cal'),
                 Decimal('4.1868'), 2, False, constants['cal (it)']),
-            (_('Kilocalorie (th), kcal'), Decimal('4184'), 2),
-            (_('Kilocalorie (it), kcal'), Decimal('4186.8'), 2),
+            (N_('Kilocalorie (th), kcal'), Decimal('4184'), 2),
+            (N_('Kilocalorie (it), kcal'), Decimal('4186.8'), 2),
             # Imperial and US customary systems
-            (_('Foot-poundal, ft-pdl'),
+            (N_('Foot-poundal, ft-pdl'),
                 Decimal('0.0421401100938048'), 3, False, constants['ft-pdl']),
-            (_('Foot-pound, ft⋅lbf'),
+            (N_('Foot-pound, ft⋅lbf'),
                 Decimal('1.3558179483314004'), 3, False, constants['ft⋅lbf']),
-            (_('British thermal unit (th), Btu'),
+            (N_('British thermal unit (th), Btu'),
                 Decimal('1054.3502644383'), 3, False, constants['Btu (th)']),
-            (_('British thermal unit (it), Btu'),
+            (N_('British thermal unit (it), Btu'),
                 Decimal('1055.05585262'), 3, False, constants['Btu (it)']),
-            (_('Therm (US), thm'),
+            (N_('Therm (US), thm'),
                 Decimal('105480400'), 3, False, constants['thm (US)']),
-            (_('Therm (EC), thm'),
+            (N_('Therm (EC), thm'),
                 Decimal('105505585.257'), 3, False, constants['thm (EC)']),
         )
-    },
+    }),
 
-    'force': {
-        'title': _('Force'),
+    'force': (N_('Force'), lambda: {
         'pattern': (
-            (_('Newton units'), ''),
-            (_('Other force units'), ''),
-            (_('Imperial and US customary systems'), 'imperial'),
-            (_('Legacy units'), 'legacy'),
+            (N_('Newton units'), ''),
+            (N_('Other force units'), ''),
+            (N_('Imperial and US customary systems'), 'imperial'),
+            (N_('Legacy units'), 'legacy'),
         ),
         'units': (
             # Newton units
-            (_('Attonewton, aN'), Decimal('1'), 0, True),
-            (_('Femtonewton, fN'), Decimal('1E+3'), 0, True),
-            (_('Piconewton, pN'), Decimal('1E+6'), 0, True),
-            (_('Nanonewton, nN'), Decimal('1E+9'), 0, True),
-            (_('Micronewton, μN'), Decimal('1E+12'), 0, True),
-            (_('Millinewton, mN'), Decimal('1E+15'), 0),
-            (_('Centinewton, cN'), Decimal('1E+16'), 0, True),
-            (_('Decinewton, dN'), Decimal('1E+17'), 0, True),
-            (_('Newton, N'), Decimal('1E+18'), 0),
-            (_('Dekanewton, daN'), Decimal('1E+19'), 0, True),
-            (_('Hectonewton, hN'), Decimal('1E+20'), 0, True),
-            (_('Kilonewton, kN'), Decimal('1E+21'), 0),
-            (_('Meganewton, MN'), Decimal('1E+24'), 0),
-            (_('Giganewton, GN'), Decimal('1E+27'), 0, True),
-            (_('Teranewton, TN'), Decimal('1E+30'), 0, True),
-            (_('Petanewton, PN'), Decimal('1E+33'), 0, True),
-            (_('Exanewton, EN'), Decimal('1E+36'), 0, True),
+            (N_('Attonewton, aN'), Decimal('1'), 0, True),
+            (N_('Femtonewton, fN'), Decimal('1E+3'), 0, True),
+            (N_('Piconewton, pN'), Decimal('1E+6'), 0, True),
+            (N_('Nanonewton, nN'), Decimal('1E+9'), 0, True),
+            (N_('Micronewton, μN'), Decimal('1E+12'), 0, True),
+            (N_('Millinewton, mN'), Decimal('1E+15'), 0),
+            (N_('Centinewton, cN'), Decimal('1E+16'), 0, True),
+            (N_('Decinewton, dN'), Decimal('1E+17'), 0, True),
+            (N_('Newton, N'), Decimal('1E+18'), 0),
+            (N_('Dekanewton, daN'), Decimal('1E+19'), 0, True),
+            (N_('Hectonewton, hN'), Decimal('1E+20'), 0, True),
+            (N_('Kilonewton, kN'), Decimal('1E+21'), 0),
+            (N_('Meganewton, MN'), Decimal('1E+24'), 0),
+            (N_('Giganewton, GN'), Decimal('1E+27'), 0, True),
+            (N_('Teranewton, TN'), Decimal('1E+30'), 0, True),
+            (N_('Petanewton, PN'), Decimal('1E+33'), 0, True),
+            (N_('Exanewton, EN'), Decimal('1E+36'), 0, True),
             # Other force units
-            (_('Dyne, dyn'), Decimal('1E+13'), 1),
-            (_('Kilogram-force, kgf'), Decimal('9806650000000272000'), 1),
-            (_('Ton-force (metric), tf'), Decimal('9.80665E+21'), 1),
+            (N_('Dyne, dyn'), Decimal('1E+13'), 1),
+            (N_('Kilogram-force, kgf'), Decimal('9806650000000272000'), 1),
+            (N_('Ton-force (metric), tf'), Decimal('9.80665E+21'), 1),
             # Imperial and US customary systems
-            (_('Poundal, pdl'), Decimal('138254954375999900'), 2),
-            (_('Kip, kip'), Decimal('4.448221615E+21'), 2),
-            (_('Ton-force (short)'), Decimal('8.89644323E+21'), 2),
-            (_('Ton-force (long)'), Decimal('9.964016418E+21'), 2),
+            (N_('Poundal, pdl'), Decimal('138254954375999900'), 2),
+            (N_('Kip, kip'), Decimal('4.448221615E+21'), 2),
+            (N_('Ton-force (short)'), Decimal('8.89644323E+21'), 2),
+            (N_('Ton-force (long)'), Decimal('9.964016418E+21'), 2),
             # Legacy units
-            (_('Pond-force, lbf'), Decimal('4448221615254771700'), 3),
+            (N_('Pond-force, lbf'), Decimal('4448221615254771700'), 3),
         )
-    },
+    }),
 
-    'fuel': {
-        'title': _('Fuel consumption'),
+    'fuel': (N_('Fuel consumption'), lambda: {
         'pattern': (
-            (_('Metric system'), ''),
-            (_('Imperial and US customary systems'), 'imperial'),
+            (N_('Metric system'), ''),
+            (N_('Imperial and US customary systems'), 'imperial'),
         ),
         'units': (
             # Metric system
-            (_('Meter per liter, m/L'), 'm/L', 0),
-            (_('Kilometer per liter, km/L'), 'km/L', 0),
-            (_('Liters per 100 kilometers, L/100 km'), 'L/100 km', 0),
+            (N_('Meter per liter, m/L'), 'm/L', 0),
+            (N_('Kilometer per liter, km/L'), 'km/L', 0),
+            (N_('Liters per 100 kilometers, L/100 km'), 'L/100 km', 0),
             # Imperial and US customary systems
-            (_('Mile per gallon (US), mpg(us)'), 'mpg(us)', 1),
-            (_('Mile per gallon (UK), mpg(uk)'), 'mpg(uk)', 1),
+            (N_('Mile per gallon (US), mpg(us)'), 'mpg(us)', 1),
+            (N_('Mile per gallon (UK), mpg(uk)'), 'mpg(uk)', 1),
         )
-    },
+    }),
 
-    'length': {
-        'title': _('Length'),
+    'length': (N_('Length'), lambda: {
         'pattern': (
-            (_('Metric system'), ''),
-            (_('Imperial and US customary systems'), 'imperial'),
-            (_('Nautical units of length'), ''),
-            (_('Astronomical distance units'), ''),
+            (N_('Metric system'), ''),
+            (N_('Imperial and US customary systems'), 'imperial'),
+            (N_('Nautical units of length'), ''),
+            (N_('Astronomical distance units'), ''),
         ),
         'units': (
             # Metric system
-            (_('Picometer, pm'), Decimal('1'), 0, True),
-            (_('Nanometer, nm'), Decimal('1E+3'), 0, True),
-            (_('Micrometer, μm'), Decimal('1E+6'), 0),
-            (_('Millimeter, mm'), Decimal('1E+9'), 0),
-            (_('Centimeter, cm'), Decimal('1E+10'), 0),
-            (_('Decimeter, dm'), Decimal('1E+11'), 0, True),
-            (_('Meter, m'), Decimal('1E+12'), 0),
-            (_('Kilometer, km'), Decimal('1E+15'), 0),
+            (N_('Picometer, pm'), Decimal('1'), 0, True),
+            (N_('Nanometer, nm'), Decimal('1E+3'), 0, True),
+            (N_('Micrometer, μm'), Decimal('1E+6'), 0),
+            (N_('Millimeter, mm'), Decimal('1E+9'), 0),
+            (N_('Centimeter, cm'), Decimal('1E+10'), 0),
+            (N_('Decimeter, dm'), Decimal('1E+11'), 0, True),
+            (N_('Meter, m'), Decimal('1E+12'), 0),
+            (N_('Kilometer, km'), Decimal('1E+15'), 0),
             # Imperial and US customary systems
-            (_('Inch, in'), Decimal('2.54E+10'), 1),
-            (_('Inch (US), in'), Decimal('25400050800'), 1),
-            (_('Foot, ft'), Decimal('3.048E+11'), 1),
-            (_('Foot (US), ft'), Decimal('304800609601.21906'), 1),
-            (_('Yard, yd'), Decimal('9.144E+11'), 1),
-            (_('Chain, ch'), Decimal('2.01168E+13'), 1),
-            (_('Furlong, fur'), Decimal('2.01168E+14'), 1),
-            (_('Mile, mi'), Decimal('1.609344E+15'), 1),
-            (_('Statute mile (US), mi'), Decimal('1609347218694436'), 1),
+            (N_('Inch, in'), Decimal('2.54E+10'), 1),
+            (N_('Inch (US), in'), Decimal('25400050800'), 1),
+            (N_('Foot, ft'), Decimal('3.048E+11'), 1),
+            (N_('Foot (US), ft'), Decimal('304800609601.21906'), 1),
+            (N_('Yard, yd'), Decimal('9.144E+11'), 1),
+            (N_('Chain, ch'), Decimal('2.01168E+13'), 1),
+            (N_('Furlong, fur'), Decimal('2.01168E+14'), 1),
+            (N_('Mile, mi'), Decimal('1.609344E+15'), 1),
+            (N_('Statute mile (US), mi'), Decimal('1609347218694436'), 1),
             # Nautical units of length
-            (_('Nautical mile, nmi'), Decimal('1.852E+15'), 2),
+            (N_('Nautical mile, nmi'), Decimal('1.852E+15'), 2),
             # Astronomical distance units
-            (_('Astronomical unit, au'), Decimal('1.4959787069100001E+23'), 3),
-            (_('Light-second, ls'),
+            (N_('Astronomical unit, au'),
+                Decimal('1.4959787069100001E+23'), 3),
+            (N_('Light-second, ls'),
                 Decimal('2.99792458E+20'), 3, True, constants['ls']),
-            (_('Light-minute, lm'), Decimal('1.798754748E+22'), 3, True),
-            (_('Light-hour, lh'), Decimal('1.0792528488E+24'), 3, True),
-            (_('Light-day, ld'), Decimal('2.59020683712E+25'), 3, True),
-            (_('Light-week, lw'), Decimal('1.813144785984E+26'), 3, True),
-            (_('Light-month, lmn'),
+            (N_('Light-minute, lm'), Decimal('1.798754748E+22'), 3, True),
+            (N_('Light-hour, lh'), Decimal('1.0792528488E+24'), 3, True),
+            (N_('Light-day, ld'), Decimal('2.59020683712E+25'), 3, True),
+            (N_('Light-week, lw'), Decimal('1.813144785984E+26'), 3, True),
+            (N_('Light-month, lmn'),
                 Decimal('7.883942055625E+26'), 3, True, constants['lmn']),
-            (_('Light-year, ly'),
+            (N_('Light-year, ly'),
                 Decimal('9.4607304725808E+27'), 3, False, constants['ly']),
-            (_('Parsec, pc'), Decimal('3.085677581E+28'), 3),
+            (N_('Parsec, pc'), Decimal('3.085677581E+28'), 3),
         ),
-    },
+    }),
 
-    'mass': {
-        'title': _('Weight and Mass'),
+    'mass': (N_('Weight and Mass'), lambda: {
         'pattern': (
-            (_('Metric system'), ''),
-            (_('Imperial and US customary systems'), 'imperial'),
-            (_('Masses of celestial bodies'), ''),
-            (_('Legacy units'), 'legacy'),
+            (N_('Metric system'), ''),
+            (N_('Imperial and US customary systems'), 'imperial'),
+            (N_('Masses of celestial bodies'), ''),
+            (N_('Legacy units'), 'legacy'),
         ),
         'units': (
             # Metric system
-            (_('Microgram, μg'), Decimal('1'), 0, True),
-            (_('Milligram, mg'), Decimal('1E+3'), 0),
-            (_('Gram, g'), Decimal('1E+6'), 0),
-            (_('Kilogram, kg'), Decimal('1E+9'), 0),
-            (_('Tonne, t'), Decimal('1E+12'), 0),
-            (_('Kiloton, kt'), Decimal('1E+15'), 0, True),
+            (N_('Microgram, μg'), Decimal('1'), 0, True),
+            (N_('Milligram, mg'), Decimal('1E+3'), 0),
+            (N_('Gram, g'), Decimal('1E+6'), 0),
+            (N_('Kilogram, kg'), Decimal('1E+9'), 0),
+            (N_('Tonne, t'), Decimal('1E+12'), 0),
+            (N_('Kiloton, kt'), Decimal('1E+15'), 0, True),
             # Imperial and US customary systems
-            (_('Grain, gr'), Decimal('64798.91'), 1),
-            (_('Pennyweight, pwt'), Decimal('1555173.84'), 1),
-            (_('Carat, ct'), Decimal('2E+5'), 1),
-            (_('Ounce, oz'), Decimal('28349523.125'), 1),
-            (_('Pound, lbs'), Decimal('453592370'), 1),
-            (_('Hundredweight (US, short), cwt'), Decimal('45359237000'), 1),
-            (_('Hundredweight (UK, long), cwt'), Decimal('50802345440'), 1),
-            (_('Quarter (US), qr'), Decimal('11339809250'), 1),
-            (_('Quarter (UK), qr'), Decimal('12700586360'), 1),
-            (_('Stone, st'), Decimal('6350293180'), 1),
-            (_('Ton (short), ton'), Decimal('907184740000'), 1),
-            (_('Ton (long), ton'), Decimal('1016046908800'), 1),
+            (N_('Grain, gr'), Decimal('64798.91'), 1),
+            (N_('Pennyweight, pwt'), Decimal('1555173.84'), 1),
+            (N_('Carat, ct'), Decimal('2E+5'), 1),
+            (N_('Ounce, oz'), Decimal('28349523.125'), 1),
+            (N_('Pound, lbs'), Decimal('453592370'), 1),
+            (N_('Hundredweight (US, short), cwt'), Decimal('45359237000'), 1),
+            (N_('Hundredweight (UK, long), cwt'), Decimal('50802345440'), 1),
+            (N_('Quarter (US), qr'), Decimal('11339809250'), 1),
+            (N_('Quarter (UK), qr'), Decimal('12700586360'), 1),
+            (N_('Stone, st'), Decimal('6350293180'), 1),
+            (N_('Ton (short), ton'), Decimal('907184740000'), 1),
+            (N_('Ton (long), ton'), Decimal('1016046908800'), 1),
             # Masses of celestial bodies
-            (_("Moon mass"), Decimal('7.348E+31'), 2),
-            (_("Earth mass"), Decimal('5.9722E+33'), 2),
-            (_("Solar mass"), Decimal('1.988416E+39'), 2),
+            (N_("Moon mass"), Decimal('7.348E+31'), 2),
+            (N_("Earth mass"), Decimal('5.9722E+33'), 2),
+            (N_("Solar mass"), Decimal('1.988416E+39'), 2),
             # Legacy units
-            (_('Quintal, q'), Decimal('1E+11'), 3),
+            (N_('Quintal, q'), Decimal('1E+11'), 3),
         )
-    },
+    }),
 
-    'numbers': {
-        'title': _('Numbers'),
+    'numbers': (N_('Numbers'), lambda: {
         'pattern': (
-            (_('Numeral systems'), ''),
+            (N_('Numeral systems'), ''),
         ),
         'units': (
-            (_('Decimal'), 'decimal', 0),
-            (_('Hexadecimal'), 'hexadecimal', 0),
-            (_('Octal'), 'octal', 0),
-            (_('Binary'), 'binary', 0),
+            (N_('Decimal'), 'decimal', 0),
+            (N_('Hexadecimal'), 'hexadecimal', 0),
+            (N_('Octal'), 'octal', 0),
+            (N_('Binary'), 'binary', 0),
+            (N_('Base 32'), 'base32', 0, False, '0-9 A-V'),
+            (N_('Base 36'), 'base36', 0, False, '0-9 A-Z'),
+            (N_('Base 64'), 'base64', 0, False, 'A-Z a-z 0-9 + /'),
         )
-    },
+    }),
 
-    'power': {
-        'title': _('Power'),
+    'power': (N_('Power'), lambda: {
         'pattern': (
-            (_('Watt-based units'), ''),
-            (_('Other power units'), ''),
-            (_('Imperial and US customary systems'), 'imperial'),
-            (_('Legacy units'), 'legacy'),
+            (N_('Watt-based units'), ''),
+            (N_('Other power units'), ''),
+            (N_('Imperial and US customary systems'), 'imperial'),
+            (N_('Legacy units'), 'legacy'),
         ),
         'units': (
             # Watt-based units
-            (_('Attowatt, aW'), Decimal('1'), 0, True),
-            (_('Femtowatt, fW'), Decimal('1E+3'), 0, True),
-            (_('Picowatt, pW'), Decimal('1E+6'), 0, True),
-            (_('Nanowatt, nW'), Decimal('1E+9'), 0, True),
-            (_('Microwatt, µW'), Decimal('1E+12'), 0, True),
-            (_('Milliwatt, mW'), Decimal('1E+15'), 0, True),
-            (_('Centiwatt, nW'), Decimal('1E+16'), 0, True),
-            (_('Deciwatt, dW'), Decimal('1E+17'), 0, True),
-            (_('Watt, W'), Decimal('1E+18'), 0),
-            (_('Dekawatt, daW'), Decimal('1E+19'), 0, True),
-            (_('Hectowatt, hW'), Decimal('1E+20'), 0, True),
-            (_('Kilowatt, kW'), Decimal('1E+21'), 0),
-            (_('Megawatt, MW'), Decimal('1E+24'), 0),
-            (_('Gigawatt, GW'), Decimal('1E+27'), 0),
-            (_('Terawatt, TW'), Decimal('1E+30'), 0, True),
-            (_('Petawatt, PW'), Decimal('1E+33'), 0, True),
-            (_('Exawatt, EW'), Decimal('1E+36'), 0, True),
+            (N_('Attowatt, aW'), Decimal('1'), 0, True),
+            (N_('Femtowatt, fW'), Decimal('1E+3'), 0, True),
+            (N_('Picowatt, pW'), Decimal('1E+6'), 0, True),
+            (N_('Nanowatt, nW'), Decimal('1E+9'), 0, True),
+            (N_('Microwatt, µW'), Decimal('1E+12'), 0, True),
+            (N_('Milliwatt, mW'), Decimal('1E+15'), 0, True),
+            (N_('Centiwatt, nW'), Decimal('1E+16'), 0, True),
+            (N_('Deciwatt, dW'), Decimal('1E+17'), 0, True),
+            (N_('Watt, W'), Decimal('1E+18'), 0),
+            (N_('Dekawatt, daW'), Decimal('1E+19'), 0, True),
+            (N_('Hectowatt, hW'), Decimal('1E+20'), 0, True),
+            (N_('Kilowatt, kW'), Decimal('1E+21'), 0),
+            (N_('Megawatt, MW'), Decimal('1E+24'), 0),
+            (N_('Gigawatt, GW'), Decimal('1E+27'), 0),
+            (N_('Terawatt, TW'), Decimal('1E+30'), 0, True),
+            (N_('Petawatt, PW'), Decimal('1E+33'), 0, True),
+            (N_('Exawatt, EW'), Decimal('1E+36'), 0, True),
             # Other power units
-            (_('Erg per second, erg/s'), Decimal('1E+11'), 1),
-            (_('Calorie (it) per hour, cal/h'),
+            (N_('Erg per second, erg/s'), Decimal('1E+11'), 1),
+            (N_('Calorie (it) per hour, cal/h'),
                 Decimal('1163000000000007'), 1),
-            (_('Calorie (it) per second, cal/s'),
+            (N_('Calorie (it) per second, cal/s'),
                 Decimal('4186799999999929000'), 1),
-            (_('Ton of refrigeration, TR'), Decimal('3.516852842E+21'), 1),
+            (N_('Ton of refrigeration, TR'), Decimal('3.516852842E+21'), 1),
             # Imperial and US customary systems
-            (_('BTU (th) per hour, Btu/h'), Decimal('292874999992899260'), 2),
-            (_('Foot pound-force per hour'), Decimal('376616096758177'), 2),
-            (_('Foot pound-force per second'),
+            (N_('BTU (th) per hour, Btu/h'), Decimal('292874999992899260'), 2),
+            (N_('Foot pound-force per hour'), Decimal('376616096758177'), 2),
+            (N_('Foot pound-force per second'),
                 Decimal('1355817948329443300'), 2),
             # Legacy units
-            (_('Horsepower (imperial), hp'), Decimal('74569987158227022'), 3),
-            (_('Horsepower (metric), hp'), Decimal('73549875E+13'), 3),
-            (_('Horsepower (electric), hp'), Decimal('746E+18'), 3),
-            (_('Horsepower (boiler), hp'), Decimal('9.8095E+21'), 3),
+            (N_('Horsepower (imperial), hp'), Decimal('74569987158227022'), 3),
+            (N_('Horsepower (metric), hp'), Decimal('73549875E+13'), 3),
+            (N_('Horsepower (electric), hp'), Decimal('746E+18'), 3),
+            (N_('Horsepower (boiler), hp'), Decimal('9.8095E+21'), 3),
         )
-    },
+    }),
 
-    'pressure': {
-        'title': _('Pressure'),
+    'pressure': (N_('Pressure'), lambda: {
         'pattern': (
-            (_('Pascal units'), ''),
-            (_('Other pressure units'), ''),
-            (_('Imperial and US customary systems'), 'imperial'),
+            (N_('Pascal units'), ''),
+            (N_('Other pressure units'), ''),
+            (N_('Imperial and US customary systems'), 'imperial'),
         ),
         'units': (
             # Pascal units
-            (_('Attopascal, aPa'), Decimal('1'), 0, True),
-            (_('Femtopascal, fPa'), Decimal('1E+3'), 0, True),
-            (_('Picopascal, pPa'), Decimal('1E+6'), 0, True),
-            (_('Nanopascal, nPa'), Decimal('1E+9'), 0, True),
-            (_('Micropascal, µPa'), Decimal('1E+12'), 0, True),
-            (_('Millipascal, mPa'), Decimal('1E+15'), 0, True),
-            (_('Centipascal, cPa'), Decimal('1E+16'), 0, True),
-            (_('Decipascal, dPa'), Decimal('1E+17'), 0, True),
-            (_('Pascal, Pa'), Decimal('1E+18'), 0),
-            (_('Dekapascal, daPa'), Decimal('1E+19'), 0, True),
-            (_('Hectopascal, hPa'), Decimal('1E+20'), 0, True),
-            (_('Kilopascal, kPa'), Decimal('1E+21'), 0),
-            (_('Megapascal, MPa'), Decimal('1E+24'), 0),
-            (_('Gigapascal, GPa'), Decimal('1E+27'), 0),
-            (_('Terapascal, TPa'), Decimal('1E+30'), 0, True),
-            (_('Petapascal, PPa'), Decimal('1E+33'), 0, True),
-            (_('Exapascal, PPa'), Decimal('1E+36'), 0, True),
+            (N_('Attopascal, aPa'), Decimal('1'), 0, True),
+            (N_('Femtopascal, fPa'), Decimal('1E+3'), 0, True),
+            (N_('Picopascal, pPa'), Decimal('1E+6'), 0, True),
+            (N_('Nanopascal, nPa'), Decimal('1E+9'), 0, True),
+            (N_('Micropascal, µPa'), Decimal('1E+12'), 0, True),
+            (N_('Millipascal, mPa'), Decimal('1E+15'), 0, True),
+            (N_('Centipascal, cPa'), Decimal('1E+16'), 0, True),
+            (N_('Decipascal, dPa'), Decimal('1E+17'), 0, True),
+            (N_('Pascal, Pa'), Decimal('1E+18'), 0),
+            (N_('Dekapascal, daPa'), Decimal('1E+19'), 0, True),
+            (N_('Hectopascal, hPa'), Decimal('1E+20'), 0, True),
+            (N_('Kilopascal, kPa'), Decimal('1E+21'), 0),
+            (N_('Megapascal, MPa'), Decimal('1E+24'), 0),
+            (N_('Gigapascal, GPa'), Decimal('1E+27'), 0),
+            (N_('Terapascal, TPa'), Decimal('1E+30'), 0, True),
+            (N_('Petapascal, PPa'), Decimal('1E+33'), 0, True),
+            (N_('Exapascal, PPa'), Decimal('1E+36'), 0, True),
             # Other pressure units
-            (_('Millibar, mbar'), Decimal('1E+20'), 1),
-            (_('Millimetre of mercury, mmHg'), Decimal('1.33322387E+20'), 1),
-            (_('Torr'), Decimal('133322368421082810000'), 1),
-            (_('Atmosphere (technical), at'), Decimal('9.80665E+22'), 1),
-            (_('Bar, bar'), Decimal('1E+23'), 1),
-            (_('Atmosphere (standard), atm'), Decimal('1.01325E+23'), 1),
+            (N_('Millibar, mbar'), Decimal('1E+20'), 1),
+            (N_('Millimetre of mercury, mmHg'), Decimal('1.33322387E+20'), 1),
+            (N_('Torr'), Decimal('133322368421082810000'), 1),
+            (N_('Atmosphere (technical), at'), Decimal('9.80665E+22'), 1),
+            (N_('Bar, bar'), Decimal('1E+23'), 1),
+            (N_('Atmosphere (standard), atm'), Decimal('1.01325E+23'), 1),
             # Imperial and US customary systems
-            (_('Inch of mercury (60°F), inHg'), Decimal('3.37685E+21'), 2),
-            (_('Inch of mercury (32°F), inHg'), Decimal('3.38638E+21'), 2),
-            (_('Pound per square inch, psi'),
+            (N_('Inch of mercury (60°F), inHg'), Decimal('3.37685E+21'), 2),
+            (N_('Inch of mercury (32°F), inHg'), Decimal('3.38638E+21'), 2),
+            (N_('Pound per square inch, psi'),
                 Decimal('6.894757293E+21'), 2),
-            (_('Kilopound per square inch, ksi'),
+            (N_('Kilopound per square inch, ksi'),
                 Decimal('6.894757293E+24'), 2),
         )
-    },
+    }),
 
-    'speed': {
-        'title': _('Speed'),
+    'speed': (N_('Speed'), lambda: {
         'pattern': (
-            (_('Metric system'), ''),
-            (_('Imperial and US customary systems'), 'imperial'),
-            (_('Other speed units'), ''),
+            (N_('Metric system'), ''),
+            (N_('Imperial and US customary systems'), 'imperial'),
+            (N_('Other speed units'), ''),
         ),
         'units': (
             # Metric system
-            (_('Millimeter per Hour, mm/h'), Decimal('1'), 0, True),
-            (_('Millimeter per Minute, mm/min'), Decimal('60'), 0, True),
-            (_('Millimeter per Second, mm/s'), Decimal('3600'), 0, True),
-            (_('Centimeter per Hour, cm/h'), Decimal('10'), 0, True),
-            (_('Centimeter per Minute, cm/min'), Decimal('600'), 0, True),
-            (_('Centimeter per Second, cm/s'), Decimal('36000'), 0, True),
-            (_('Meter per Hour, m/h'), Decimal('1000'), 0, True),
-            (_('Meter per Minute, m/min'), Decimal('60000'), 0),
-            (_('Meter per Second, m/s'), Decimal('3600000'), 0),
-            (_('Kilometer per Hour, km/h'), Decimal('1000000'), 0),
-            (_('Kilometer per Minute, km/min'), Decimal('60000000'), 0),
-            (_('Kilometer per Second, km/s'), Decimal('3600000000'), 0, True),
+            (N_('Millimeter per Hour, mm/h'), Decimal('1'), 0, True),
+            (N_('Millimeter per Minute, mm/min'), Decimal('60'), 0, True),
+            (N_('Millimeter per Second, mm/s'), Decimal('3600'), 0, True),
+            (N_('Centimeter per Hour, cm/h'), Decimal('10'), 0, True),
+            (N_('Centimeter per Minute, cm/min'), Decimal('600'), 0, True),
+            (N_('Centimeter per Second, cm/s'), Decimal('36000'), 0, True),
+            (N_('Meter per Hour, m/h'), Decimal('1000'), 0, True),
+            (N_('Meter per Minute, m/min'), Decimal('60000'), 0),
+            (N_('Meter per Second, m/s'), Decimal('3600000'), 0),
+            (N_('Kilometer per Hour, km/h'), Decimal('1000000'), 0),
+            (N_('Kilometer per Minute, km/min'), Decimal('60000000'), 0),
+            (N_('Kilometer per Second, km/s'), Decimal('3600000000'), 0, True),
             # Imperial and US customary systems
-            (_('Feet per Hour, ft/h'), Decimal('304.8'), 1, True),
-            (_('Feet per Minute, ft/min'), Decimal('18288'), 1),
-            (_('Feet per Second, ft/s'), Decimal('1097280'), 1),
-            (_('Yard per Hour, yd/h'), Decimal('914.4'), 1, True),
-            (_('Yard per Minute, yd/min'), Decimal('54864'), 1, True),
-            (_('Yard per Second, yd/s'), Decimal('3291840'), 1),
-            (_('Mile per Hour, mi/h'), Decimal('1609344'), 1),
-            (_('Mile per Minute, mi/min'), Decimal('96560640'), 1, True),
-            (_('Mile per Second, mi/s'), Decimal('5793638400'), 1, True),
+            (N_('Feet per Hour, ft/h'), Decimal('304.8'), 1, True),
+            (N_('Feet per Minute, ft/min'), Decimal('18288'), 1),
+            (N_('Feet per Second, ft/s'), Decimal('1097280'), 1),
+            (N_('Yard per Hour, yd/h'), Decimal('914.4'), 1, True),
+            (N_('Yard per Minute, yd/min'), Decimal('54864'), 1, True),
+            (N_('Yard per Second, yd/s'), Decimal('3291840'), 1),
+            (N_('Mile per Hour, mi/h'), Decimal('1609344'), 1),
+            (N_('Mile per Minute, mi/min'), Decimal('96560640'), 1, True),
+            (N_('Mile per Second, mi/s'), Decimal('5793638400'), 1, True),
             # Other speed units
-            (_('Knot, kn'), Decimal('1852000'), 2),
-            (_('Mach (SI)'), Decimal('1062167040'), 2),
-            (_('Mach (20°C, 1 atm)'), Decimal('1236960000'), 2),
-            (_('Cosmic velocity - first'), Decimal('28440000000'), 2),
-            (_('Cosmic velocity - second'), Decimal('40320000000'), 2),
-            (_('Cosmic velocity - third'), Decimal('60012000000'), 2),
-            (_("Earth's velocity"), Decimal('107154000000'), 2),
-            (_('Speed of light (vacuum)'), Decimal('1079252848799998'), 2),
+            (N_('Knot, kn'), Decimal('1852000'), 2),
+            (N_('Mach (SI)'), Decimal('1062167040'), 2),
+            (N_('Mach (20°C, 1 atm)'), Decimal('1236960000'), 2),
+            (N_('Cosmic velocity - first'), Decimal('28440000000'), 2),
+            (N_('Cosmic velocity - second'), Decimal('40320000000'), 2),
+            (N_('Cosmic velocity - third'), Decimal('60012000000'), 2),
+            (N_("Earth's velocity"), Decimal('107154000000'), 2),
+            (N_('Speed of light (vacuum)'), Decimal('1079252848799998'), 2),
         )
-    },
+    }),
 
-    'temperature': {
-        'title': _('Temperature'),
+    'temperature': (N_('Temperature'), lambda: {
         'pattern': (
-            (_('SI system'), ''),
-            (_('Imperial and US customary systems'), 'imperial'),
-            (_('Legacy units'), 'legacy'),
+            (N_('SI system'), ''),
+            (N_('Imperial and US customary systems'), 'imperial'),
+            (N_('Legacy units'), 'legacy'),
 
         ),
         'units': (
             # SI system
-            (_('Celsius, °C'), 'celsius', 0),
-            (_('Kelvin, K'), 'kelvin', 0),
+            (N_('Celsius, °C'), 'celsius', 0),
+            (N_('Kelvin, K'), 'kelvin', 0),
             # Imperial and US customary systems
-            (_('Fahrenheit, °F'), 'fahrenheit', 1),
-            (_('Rankine, °R'), 'rankine', 1),
+            (N_('Fahrenheit, °F'), 'fahrenheit', 1),
+            (N_('Rankine, °R'), 'rankine', 1),
             # Legacy units
-            (_('Reaumur, °r'), 'reaumur', 2),
+            (N_('Reaumur, °r'), 'reaumur', 2),
         )
-    },
+    }),
 
-    'time': {
-        'title': _('Time'),
+    'time': (N_('Time'), lambda: {
         'pattern': (
-            (_('Units of time'), ''),
+            (N_('Units of time'), ''),
         ),
         'units': (
-            (_('Attosecond, as'), Decimal('1'), 0, True),
-            (_('Femtosecond, fs'), Decimal('1E+3'), 0, True),
-            (_('Picosecond, fs'), Decimal('1E+6'), 0, True),
-            (_('Nanosecond, ns'), Decimal('1E+9'), 0),
-            (_('Microsecond, μs'), Decimal('1E+12'), 0),
-            (_('Millisecond, ms'), Decimal('1E+15'), 0),
-            (_('Second, s'), Decimal('1E+18'), 0),
-            (_('Minute, min'), Decimal('6E+19'), 0),
-            (_('Hour, h'), Decimal('3.6E+21'), 0),
-            (_('Day, d'), Decimal('8.64E+22'), 0),
-            (_('Week'), Decimal('6.048E+23'), 0),
-            (_('Month'), Decimal('2.628E+24'), 0),
-            (_('Year (365 days), y'), Decimal('3.1535999999999997E+25'), 0),
-            (_('Decade'), Decimal('3.155759999E+26'), 0),
-            (_('Century'), Decimal('3.155759999E+27'), 0),
-            (_('Millennium'), Decimal('3.155759999E+28'), 0),
+            (N_('Attosecond, as'), Decimal('1'), 0, True),
+            (N_('Femtosecond, fs'), Decimal('1E+3'), 0, True),
+            (N_('Picosecond, fs'), Decimal('1E+6'), 0, True),
+            (N_('Nanosecond, ns'), Decimal('1E+9'), 0),
+            (N_('Microsecond, μs'), Decimal('1E+12'), 0),
+            (N_('Millisecond, ms'), Decimal('1E+15'), 0),
+            (N_('Second, s'), Decimal('1E+18'), 0),
+            (N_('Minute, min'), Decimal('6E+19'), 0),
+            (N_('Hour, h'), Decimal('3.6E+21'), 0),
+            (N_('Day, d'), Decimal('8.64E+22'), 0),
+            (N_('Week'), Decimal('6.048E+23'), 0),
+            (N_('Month'), Decimal('2.628E+24'), 0),
+            (N_('Year (365 days), y'), Decimal('3.1535999999999997E+25'), 0),
+            (N_('Decade'), Decimal('3.155759999E+26'), 0),
+            (N_('Century'), Decimal('3.155759999E+27'), 0),
+            (N_('Millennium'), Decimal('3.155759999E+28'), 0),
         )
-    },
+    }),
 
-    'volume': {
-        'title': _('Volume'),
+    'volume': (N_('Volume'), lambda: {
         'pattern': (
-            (_('Metric system'), ''),
-            (_('Imperial and US customary systems'), 'imperial'),
+            (N_('Metric system'), ''),
+            (N_('Imperial and US customary systems'), 'imperial'),
         ),
         'units': (
             # Metric system
-            (_('Cubic millimeter, mm^3'), Decimal('1'), 0),
-            (_('Cubic centimeter, cm^3'), Decimal('1E+3'), 0),
-            (_('Cubic decimeter, dm^3'), Decimal('1E+6'), 0),
-            (_('Cubic meter, m^3'), Decimal('1E+9'), 0),
-            (_('Cubic kilometer, km^3'), Decimal('1E+18'), 0),
-            (_('Milliliter, mL'), Decimal('1E+3'), 0),
-            (_('Liter, L'), Decimal('1E+6'), 0),
+            (N_('Cubic millimeter, mm^3'), Decimal('1'), 0),
+            (N_('Cubic centimeter, cm^3'), Decimal('1E+3'), 0),
+            (N_('Cubic decimeter, dm^3'), Decimal('1E+6'), 0),
+            (N_('Cubic meter, m^3'), Decimal('1E+9'), 0),
+            (N_('Cubic kilometer, km^3'), Decimal('1E+18'), 0),
+            (N_('Milliliter, mL'), Decimal('1E+3'), 0),
+            (N_('Liter, L'), Decimal('1E+6'), 0),
             # Imperial and US customary systems
-            (_('Cubic inch, in^3'), Decimal('16387.064'), 1),
-            (_('Cubic foot, ft^3'), Decimal('28316846.592'), 1),
-            (_('Cubic yard, yd^3'), Decimal('764554857.984'), 1),
-            (_('Cubic mile, mi^3'), Decimal('4168181825440539600'), 1),
-            (_('Acre - inch, ac⋅in'), Decimal('102790153129'), 1),
-            (_('Acre - foot, ac⋅ft'), Decimal('1233481837548'), 1),
-            (_('Acre - foot (US), ac⋅ft'), Decimal('1233489238468'), 1),
-            (_('Ounce, oz'), Decimal('28413.0625'), 1),
-            (_('Ounce (US), oz'), Decimal('29573.529562'), 1),
-            (_('Gill, gi'), Decimal('142065.3125'), 1),
-            (_('Gill (US), gi'), Decimal('118294.11825'), 1),
-            (_('Pint, pt'), Decimal('568261.25'), 1),
-            (_('Pint (US), pt'), Decimal('473176.473'), 1),
-            (_('Quart, qt'), Decimal('1136522.5'), 1),
-            (_('Quart (US), qt'), Decimal('946352.946'), 1),
-            (_('Gallon, gal'), Decimal('4546090'), 1),
-            (_('Gallon (US), gal'), Decimal('3785411.784'), 1),
-            (_('Barrel, bbl'), Decimal('163659240'), 1),
-            (_('Barrel (US), bbl'), Decimal('119240471.2'), 1),
-            (_('Barrel (oil), bbl'), Decimal('158987294.93'), 1),
+            (N_('Cubic inch, in^3'), Decimal('16387.064'), 1),
+            (N_('Cubic foot, ft^3'), Decimal('28316846.592'), 1),
+            (N_('Cubic yard, yd^3'), Decimal('764554857.984'), 1),
+            (N_('Cubic mile, mi^3'), Decimal('4168181825440539600'), 1),
+            (N_('Acre - inch, ac⋅in'), Decimal('102790153129'), 1),
+            (N_('Acre - foot, ac⋅ft'), Decimal('1233481837548'), 1),
+            (N_('Acre - foot (US), ac⋅ft'), Decimal('1233489238468'), 1),
+            (N_('Ounce, oz'), Decimal('28413.0625'), 1),
+            (N_('Ounce (US), oz'), Decimal('29573.529562'), 1),
+            (N_('Gill, gi'), Decimal('142065.3125'), 1),
+            (N_('Gill (US), gi'), Decimal('118294.11825'), 1),
+            (N_('Pint, pt'), Decimal('568261.25'), 1),
+            (N_('Pint (US), pt'), Decimal('473176.473'), 1),
+            (N_('Quart, qt'), Decimal('1136522.5'), 1),
+            (N_('Quart (US), qt'), Decimal('946352.946'), 1),
+            (N_('Gallon, gal'), Decimal('4546090'), 1),
+            (N_('Gallon (US), gal'), Decimal('3785411.784'), 1),
+            (N_('Barrel, bbl'), Decimal('163659240'), 1),
+            (N_('Barrel (US), bbl'), Decimal('119240471.2'), 1),
+            (N_('Barrel (oil), bbl'), Decimal('158987294.93'), 1),
         )
-    },
+    }),
 
-    'wave': {
-        'title': _('Frequency\nWavelength'),
+    'wave': (N_('Frequency\nWavelength'), lambda: {
         'pattern': (
-            (_('Frequency, metric system'), ''),
-            (_('Frequency, other units'), ''),
-            (_('Wavelength, metric system'), ''),
-            (_('Wavelength, imperial and US customary systems'), 'imperial'),
+            (N_('Frequency, metric system'), ''),
+            (N_('Frequency, other units'), ''),
+            (N_('Wavelength, metric system'), ''),
+            (N_('Wavelength, imperial and US customary systems'), 'imperial'),
         ),
         'units': (
             # Frequency, metric system
-            (_('Attohertz, aHz'), Decimal('1E-18'), 0, True),
-            (_('Femtohertz, fHz'), Decimal('1E-15'), 0, True),
-            (_('Picohertz, pHz'), Decimal('1E-12'), 0, True),
-            (_('Nanohertz, nHz'), Decimal('1E-9'), 0, True),
-            (_('Microhertz, µHz'), Decimal('1E-6'), 0, True),
-            (_('Millihertz, mHz'), Decimal('1E-3'), 0, True),
-            (_('Hertz, Hz'), Decimal('1'), 0),
-            (_('Kilohertz, kHz'), Decimal('1E+3'), 0),
-            (_('Megahertz, MHz'), Decimal('1E+6'), 0),
-            (_('Gigahertz, GHz'), Decimal('1E+9'), 0),
-            (_('Terahertz, THz'), Decimal('1E+12'), 0, True),
-            (_('Petahertz, PHz'), Decimal('1E+15'), 0, True),
-            (_('Exahertz, EHz'), Decimal('1E+18'), 0, True),
+            (N_('Attohertz, aHz'), Decimal('1E-18'), 0, True),
+            (N_('Femtohertz, fHz'), Decimal('1E-15'), 0, True),
+            (N_('Picohertz, pHz'), Decimal('1E-12'), 0, True),
+            (N_('Nanohertz, nHz'), Decimal('1E-9'), 0, True),
+            (N_('Microhertz, µHz'), Decimal('1E-6'), 0, True),
+            (N_('Millihertz, mHz'), Decimal('1E-3'), 0, True),
+            (N_('Hertz, Hz'), Decimal('1'), 0),
+            (N_('Kilohertz, kHz'), Decimal('1E+3'), 0),
+            (N_('Megahertz, MHz'), Decimal('1E+6'), 0),
+            (N_('Gigahertz, GHz'), Decimal('1E+9'), 0),
+            (N_('Terahertz, THz'), Decimal('1E+12'), 0, True),
+            (N_('Petahertz, PHz'), Decimal('1E+15'), 0, True),
+            (N_('Exahertz, EHz'), Decimal('1E+18'), 0, True),
             # Frequency, other units
-            (_('Degree per second, deg/s'),
+            (N_('Degree per second, deg/s'),
                 Decimal('1') / Decimal('360'), 1),
-            (_('Radian per second, rad/s'),
+            (N_('Radian per second, rad/s'),
                 Decimal('1') / (Decimal('2') * PI), 1),
-            (_('Revolutions per minute, RPM'),
+            (N_('Revolutions per minute, RPM'),
                 Decimal('1') / Decimal('60'), 1, False, constants['RPM']),
-            (_('Beats per minute, BPM'),
+            (N_('Beats per minute, BPM'),
                 Decimal('1') / Decimal('60'), 1, False, constants['BPM']),
             # Wavelength, metric system
-            (_('Angstrom, Å'), Decimal('1E-10'), 2),
-            (_('Wavelength, picometer'), Decimal('1E-12'), 2, True),
-            (_('Wavelength, nanometer'), Decimal('1E-9'), 2),
-            (_('Wavelength, micrometer'), Decimal('1E-6'), 2),
-            (_('Wavelength, millimeter'), Decimal('1E-3'), 2, True),
-            (_('Wavelength, centimeter'), Decimal('1E-2'), 2),
-            (_('Wavelength, decimeter'), Decimal('0.1'), 2, True),
-            (_('Wavelength, meter'), Decimal('1'), 2),
-            (_('Wavelength, kilometer'), Decimal('1E+3'), 2, True),
+            (N_('Angstrom, Å'), Decimal('1E-10'), 2),
+            (N_('Wavelength, picometer'), Decimal('1E-12'), 2, True),
+            (N_('Wavelength, nanometer'), Decimal('1E-9'), 2),
+            (N_('Wavelength, micrometer'), Decimal('1E-6'), 2),
+            (N_('Wavelength, millimeter'), Decimal('1E-3'), 2, True),
+            (N_('Wavelength, centimeter'), Decimal('1E-2'), 2),
+            (N_('Wavelength, decimeter'), Decimal('0.1'), 2, True),
+            (N_('Wavelength, meter'), Decimal('1'), 2),
+            (N_('Wavelength, kilometer'), Decimal('1E+3'), 2, True),
             # Wavelength, imperial and US customary systems
-            (_('Wavelength, inch'), Decimal('0.0254'), 3),
-            (_('Wavelength, inch (US)'), Decimal('0.0254000508'), 3),
-            (_('Wavelength, foot'), Decimal('0.3048'), 3),
-            (_('Wavelength, foot (US)'),
+            (N_('Wavelength, inch'), Decimal('0.0254'), 3),
+            (N_('Wavelength, inch (US)'), Decimal('0.0254000508'), 3),
+            (N_('Wavelength, foot'), Decimal('0.3048'), 3),
+            (N_('Wavelength, foot (US)'),
                 Decimal('1200') / Decimal('3937'), 3),
-            (_('Wavelength, yard'), Decimal('0.9144'), 3),
-            (_('Wavelength, mile'), Decimal('1609.344'), 3),
+            (N_('Wavelength, yard'), Decimal('0.9144'), 3),
+            (N_('Wavelength, mile'), Decimal('1609.344'), 3),
         ),
-    },
+    }),
 
-}
+})
 
 
 # ------------------------------------------------------------------------------
 
 
+def exact_ratios() -> dict:
+    # exact ratios, in the base unit of each quantity, of the units whose
+    # literal above is a rounded binary float, a quotient or a truncated
+    # value; the other literals are exact by definition, π stays at 50
+    # digits; built on first use, the exact mode is off by default
+    from fractions import Fraction
+
+    INCH = Fraction('0.0254')  # m
+    FOOT = 12 * INCH
+    YARD = 3 * FOOT
+    MILE = 5280 * FOOT
+    FOOT_US = Fraction(1200, 3937)  # survey foot
+    ACRE = 4840 * YARD ** 2
+    ACRE_US = 43560 * FOOT_US ** 2
+    AU = 149597870700  # m
+    POUND = Fraction('0.45359237')  # kg
+    STANDARD_GRAVITY = Fraction('9.80665')
+    LBF = POUND * STANDARD_GRAVITY
+    CAL_IT = Fraction('4.1868')  # J
+    BTU_IT = Fraction('1055.05585262')  # J
+    GALLON_US = 231 * INCH ** 3
+    DAY = 86400  # s
+    E9 = 10 ** 9
+    E12 = 10 ** 12
+    E18 = 10 ** 18
+
+    return {
+        'area': {  # nm^2
+            'Square astronomical unit, au^2': AU ** 2 * E18,
+            'Square foot, ft^2': FOOT ** 2 * E18,
+            'Square foot (US), ft^2': FOOT_US ** 2 * E18,
+            'Square yard, yd^2': YARD ** 2 * E18,
+            'Acre (US), ac': ACRE_US * E18,
+            'Square mile (US), mi^2': (5280 * FOOT_US) ** 2 * E18,
+        },
+        'force': {  # aN
+            'Kilogram-force, kgf': STANDARD_GRAVITY * E18,
+            'Poundal, pdl': POUND * FOOT * E18,
+            'Kip, kip': 1000 * LBF * E18,
+            'Ton-force (long)': 2240 * LBF * E18,
+            'Pond-force, lbf': LBF * E18,
+        },
+        'length': {  # pm
+            'Inch (US), in': FOOT_US / 12 * E12,
+            'Foot (US), ft': FOOT_US * E12,
+            'Statute mile (US), mi': 5280 * FOOT_US * E12,
+            'Astronomical unit, au': AU * E12,
+        },
+        'power': {  # aW
+            'Calorie (it) per hour, cal/h': CAL_IT / 3600 * E18,
+            'Calorie (it) per second, cal/s': CAL_IT * E18,
+            'Ton of refrigeration, TR': 12000 * BTU_IT / 3600 * E18,
+            'BTU (th) per hour, Btu/h': Fraction('0.292875') * E18,
+            'Foot pound-force per hour': FOOT * LBF / 3600 * E18,
+            'Foot pound-force per second': FOOT * LBF * E18,
+        },
+        'pressure': {  # aPa
+            'Torr': Fraction(101325, 760) * E18,
+            'Pound per square inch, psi': LBF / INCH ** 2 * E18,
+            'Kilopound per square inch, ksi': 1000 * LBF / INCH ** 2 * E18,
+        },
+        'speed': {  # mm/h
+            'Speed of light (vacuum)': 299792458 * 3600 * 1000,
+        },
+        'time': {  # as
+            'Year (365 days), y': 365 * DAY * E18,
+            'Decade': Fraction('3652.5') * DAY * E18,
+            'Century': 36525 * DAY * E18,
+            'Millennium': 365250 * DAY * E18,
+        },
+        'volume': {  # mm^3
+            'Cubic mile, mi^3': MILE ** 3 * E9,
+            'Acre - inch, ac⋅in': ACRE * INCH * E9,
+            'Acre - foot, ac⋅ft': ACRE * FOOT * E9,
+            'Acre - foot (US), ac⋅ft': ACRE_US * FOOT_US * E9,
+            'Ounce (US), oz': GALLON_US / 128 * E9,
+            'Barrel (US), bbl': Fraction(63, 2) * GALLON_US * E9,
+            'Barrel (oil), bbl': 42 * GALLON_US * E9,
+        },
+    }
+
+
+# ------------------------------------------------------------------------------
+
+
+MISSING = object()
+
+# converted by functions of their own, the others are a ratio of units
+SPECIAL = ('temperature', 'numbers', 'fuel', 'wave')
+
+# values of a series: lines, tabs, ";" or ", " with a space, so that
+# "1,5" is still a decimal comma
+SERIES = re.compile(r'\s*(?:[\n\t;]|, )\s*')
+
+
+class Cache:
+    # least recently used results, with hit and miss counters
+
+    def __init__(self, size: int):
+        self.size = size
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        value = self.data.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+            return default
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.data[key] = value
+        if len(self.data) > self.size:
+            self.data.popitem(last=False)
+
+    def resize(self, size: int):
+        self.size = size
+        while len(self.data) > size:
+            self.data.popitem(last=False)
+
+    def clear(self):
+        self.data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict:
+        return {
+            'size': self.size,
+            'length': len(self.data),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+# a miss in the processing cache costs about as much as formatting itself,
+# it only pays off when the same outputs repeat for different inputs
+conversion_cache = Cache(1024)
+processing_cache = Cache(0)
+
+CACHE_VALUE = 256  # characters, the longest value kept in the cache
+
+
 def conversion(quantity: str,
                index: int,
                value: Decimal | str,
@@ -696,44 +939,292 @@ def conversion(quantity: str,
                quantize: int,
                scientific: int) -> list | None:
 
-    _quantize = f'{0:.{quantize}f}'
+    # not kept: the numeral systems and long values, such as a pasted
+    # memory dump, whose results would hold megabytes per entry
+    if not conversion_cache.size or quantity == 'numbers':
+        return convert(quantity, index, value,
+                       precision, quantize, scientific)
+    # str() keeps apart the values that compare equal, such as 0 and -0
+    text = str(value)
+    if len(text) > CACHE_VALUE:
+        return convert(quantity, index, value,
+                       precision, quantize, scientific)
+
+    key = (quantity, index, text, type(value) is str,
+           precision, quantize, scientific, exact_mode)
+    result = conversion_cache.get(key, MISSING)
+    if result is MISSING:
+        result = convert(quantity, index, value,
+                         precision, quantize, scientific)
+        if result is not None:
+            result = tuple(result)
+        conversion_cache.put(key, result)
+
+    return list(result) if result is not None else None
+
+
+def convert(quantity: str,
+            index: int,
+            value: Decimal | str,
+            precision: int,
+            quantize: int,
+            scientific: int) -> list | None:
+
+    _quantize = quantum(quantize)
+
+    # a local context, the precision of the caller's thread is kept
+    with localcontext(Context(prec=precision)):
+        units = quantities[quantity]['units']
+        result = []
+
+        match quantity:
+
+            case 'temperature':
+                if type(value) is Decimal:
+                    temperature = find_temperature(units.values[index], value)
+                    for t in temperature:
+                        # kelvin and rankine may be clamped to 0
+                        v = Decimal(t)
+                        try:
+                            v = v.quantize(_quantize)
+                        except BaseException:
+                            pass  # too many digits for the precision
+                        v = v.normalize()
+                        result.append(str(v))
+
+            case 'numbers':
+                return convert_numbers(units.values[index], value)
+
+            case 'fuel':
+                return convert_fuel(units.values[index], value,
+                                    _quantize, scientific)
+
+            case 'wave':
+                return convert_wave(index, value, _quantize, scientific)
+
+            case _:
+                if type(value) is str:
+                    return None
+                if exact_mode:
+                    return convert_exact(quantity, index, value,
+                                         precision, quantize, scientific)
+                if (adaptive_precision and precision > ADAPTIVE_DIGITS and
+                        len(value.as_tuple().digits) > ADAPTIVE_DIGITS):
+                    return convert_adaptive(quantity, index, value,
+                                            precision, quantize, scientific)
+                # unit conversion, one multiplication per unit
+                for ratio in conversion_matrix(quantity, precision)[index]:
+                    v = value * ratio
+                    result.append(value_processing(v, _quantize, scientific))
+
+    return result if len(result) > 0 else None
 
-    getcontext().prec = precision
+
+def series_split(text: str) -> list[str] | None:
+    # None: a single value
+    text = text.strip()
+    if SERIES.search(text) is None:
+        return None
+    return [t for t in SERIES.split(text) if t]
+
+
+def conversion_series(quantity: str,
+                      index: int,
+                      values: list,
+                      precision: int,
+                      quantize: int,
+                      scientific: int) -> list[list[str]]:
+    # columns: the values in every unit, '' for the values that fail,
+    # one matrix row and one context for the whole series
     units = quantities[quantity]['units']
-    result = []
+    if quantity in SPECIAL or exact_mode:
+        columns = [[] for _ in units.values]
+        for value in values:
+            result = None
+            if value is not None:
+                result = convert(quantity, index, value,
+                                 precision, quantize, scientific)
+            if result is None:
+                result = [''] * len(columns)
+            for column, text in zip(columns, result):
+                column.append(text)
+        return columns
+
+    _quantize = quantum(quantize)
+    with localcontext(Context(prec=precision)):
+        values = [v if type(v) is Decimal else None for v in values]
+        return [[value_processing(v * ratio, _quantize, scientific)
+                 if v is not None else '' for v in values]
+                for ratio in conversion_matrix(quantity, precision)[index]]
 
-    match quantity:
 
-        case 'temperature':
-            if type(value) is Decimal:
-                temperature = find_temperature(units[index][1], value)
-                for t in temperature:
-                    try:
-                        v = t.quantize(Decimal(_quantize))
-                    except BaseException:
-                        pass
-                    v = v.normalize()
-                    result.append(str(v))
+# ------------------------------------------------------------------------------
 
-        case 'numbers':
-            return convert_numbers(units[index][1], value)
 
-        case 'fuel':
-            return convert_fuel(units[index][1], value, _quantize, scientific)
+# matrices[quantity][source][target] = ratio of the source unit to the target
+matrices = {}
+matrices_precision = 0
 
-        case 'wave':
-            return convert_wave(index, value, _quantize, scientific)
+MATRIX_GUARD = 4
 
-        case _:
-            if type(value) is str:
-                return None
-            base_value = value * units[index][1]  # to the lowest value
-            # unit conversion
-            for u in units:
-                v = base_value / u[1]
+
+class Matrix:
+    # rows of ratios, each computed on first use: a conversion only needs
+    # the row of its source unit, n divisions instead of n * n
+
+    __slots__ = ('ratios', 'precision', 'rows')
+
+    def __init__(self, ratios: tuple, precision: int):
+        self.ratios = ratios
+        self.precision = precision
+        self.rows = [None] * len(ratios)
+
+    def __getitem__(self, index: int) -> tuple:
+        row = self.rows[index]
+        if row is None:
+            # guard digits, so that only the final product is rounded
+            with localcontext(Context(prec=self.precision + MATRIX_GUARD)):
+                s = self.ratios[index]
+                row = tuple(s / t for t in self.ratios)
+            self.rows[index] = row
+        return row
+
+    def __len__(self) -> int:
+        return len(self.ratios)
+
+
+def conversion_matrix(quantity: str, precision: int) -> Matrix:
+    global matrices_precision
+
+    # the ratios are only valid for the precision they were computed with
+    if precision != matrices_precision:
+        matrices.clear()
+        lengths.clear()
+        matrices_precision = precision
+
+    matrix = matrices.get(quantity)
+    if matrix is None:
+        matrix = matrices[quantity] = Matrix(
+            quantities[quantity]['units'].values, precision)
+
+    return matrix
+
+
+# adaptive precision: the digits below the quantum are not shown, a long
+# product is worked out to the quantum and a few guard digits only
+adaptive_precision = True
+ADAPTIVE_GUARD = 4
+ADAPTIVE_ERROR = Decimal(16)  # units in the last place of the product
+# the check costs more than the digits it saves on shorter values
+ADAPTIVE_DIGITS = 400
+
+contexts = {}  # precision: Context
+lengths = {}  # (quantity, index): digits of each ratio of the row
+
+
+def context(precision: int) -> Context:
+    c = contexts.get(precision)
+    if c is None:
+        c = contexts[precision] = Context(prec=precision)
+    return c
+
+
+def convert_adaptive(quantity: str,
+                     index: int,
+                     value: Decimal,
+                     precision: int,
+                     quantize: int,
+                     scientific: int) -> list:
+    # the same strings as at the full precision: the exact product lies
+    # within ADAPTIVE_ERROR units in the last place of the short one,
+    # when both ends round to the same quantum, so does the full product
+    row = conversion_matrix(quantity, precision)[index]
+    digits = lengths.get((quantity, index))
+    if digits is None:
+        digits = lengths[(quantity, index)] = tuple(
+            len(r.as_tuple().digits) for r in row)
+
+    _quantize = quantum(quantize)
+    full = context(precision)
+    value_digits = len(value.as_tuple().digits)
+    magnitude = value.adjusted() + 2 + quantize  # digits to the quantum
+    result = []
+    for ratio, ratio_digits in zip(row, digits):
+        p = max(magnitude + ratio.adjusted(), 1) + ADAPTIVE_GUARD
+        # short operands: the product is cheap, nothing to save
+        if p < precision and value_digits + ratio_digits > p:
+            c = context(p)
+            v = c.multiply(c.plus(value), c.plus(ratio))
+            error = ADAPTIVE_ERROR.scaleb(v.adjusted() - p + 1)
+            if (full.quantize(full.subtract(v, error), _quantize) ==
+                    full.quantize(full.add(v, error), _quantize)):
                 result.append(value_processing(v, _quantize, scientific))
+                continue
+        # close to a tie of the quantum, or nothing to save
+        v = full.multiply(value, ratio)
+        result.append(value_processing(v, _quantize, scientific))
+    return result
 
-    return result if len(result) > 0 else None
+
+# exact mode: ratios as integer pairs, see exact_ratios(), the products
+# are exact and rounded once, to the quantum
+exact_mode = False
+
+exact_overrides = None  # see exact_ratios()
+exact_units = {}  # quantity: (Fraction, ...)
+exact_rows = {}  # (quantity, index): ((numerator, denominator), ...)
+limits = {}  # precision: 10 ** precision
+
+
+def exact_row(quantity: str, index: int) -> tuple:
+    global exact_overrides
+    row = exact_rows.get((quantity, index))
+    if row is None:
+        ratios = exact_units.get(quantity)
+        if ratios is None:
+            from fractions import Fraction
+            if exact_overrides is None:
+                exact_overrides = exact_ratios()
+            units = quantities[quantity]['units']
+            overrides = exact_overrides.get(quantity, {})
+            ratios = exact_units[quantity] = tuple(
+                Fraction(overrides.get(title, value))
+                for title, value in zip(units.titles, units.values))
+        s = ratios[index]
+        row = exact_rows[(quantity, index)] = tuple(
+            (r.numerator, r.denominator) for r in (s / t for t in ratios))
+    return row
+
+
+def convert_exact(quantity: str,
+                  index: int,
+                  value: Decimal,
+                  precision: int,
+                  quantize: int,
+                  scientific: int) -> list:
+    limit = limits.get(precision)
+    if limit is None:
+        limit = limits[precision] = 10 ** precision
+    _quantize = quantum(quantize)
+    scale = 10 ** quantize
+    n, d = value.as_integer_ratio()
+    result = []
+    for rn, rd in exact_row(quantity, index):
+        numerator = n * rn
+        denominator = d * rd
+        # half to even, the remainder decides
+        k, r = divmod(numerator * scale, denominator)
+        r += r
+        if r > denominator or (r == denominator and k & 1):
+            k += 1
+        if -limit < k < limit:
+            v = Decimal(k).scaleb(-quantize)
+        else:
+            # more digits than the precision: rounded to it instead,
+            # as the quantize of the Decimal path fails then
+            v = Decimal(numerator) / Decimal(denominator)
+        result.append(value_processing(v, _quantize, scientific))
+    return result
 
 
 # ------------------------------------------------------------------------------
@@ -810,61 +1301,38 @@ def find_temperature(identifier: str, value: Decimal):
 def convert_numbers(identifier: str, value: Decimal | str) -> list[str] | None:
 
     # important: all return values ​​must be strings
+    # value: the text as typed, a Decimal is accepted for the decimal system
+    from .radix import base_of, int_to_text, text_to_int  # on first use
 
-    if type(value) is Decimal:
-        value_int = int(value.to_integral_value(rounding='ROUND_HALF_UP'))
-        value_str = str(value_int)
-    elif type(value) is str:
-        value_str = value
-        if identifier == 'hexadecimal':
-            try:
-                value_int = int(value_str, 16)
-            except ValueError:
-                return None
+    try:
+        if type(value) is Decimal:
+            number = int(value.to_integral_value(rounding='ROUND_HALF_UP'))
         else:
-            return None
-
-    match identifier:
-        case 'decimal':
-            result = [
-                value_str,                   # decimal
-                hex(value_int)[2:].upper(),  # hexadecimal
-                oct(value_int)[2:],          # octal
-                bin(value_int)[2:],          # binary
-            ]
-        case 'hexadecimal':
-            result = [
-                str(value_int),
-                value_str,
-                oct(value_int)[2:],
-                bin(value_int)[2:],
-            ]
-        case 'octal':
-            d = int(value_str, 8)
-            result = [
-                str(d),
-                hex(d)[2:].upper(),
-                value_str,
-                bin(d)[2:],
-            ]
-        case 'binary':
             try:
-                d = int(value_str, 2)
+                number = text_to_int(value, base_of(identifier))
             except ValueError:
-                return None
-            result = [
-                str(d),
-                hex(d)[2:].upper(),
-                oct(d)[2:],
-                value_str,
-            ]
+                if identifier != 'decimal':
+                    raise
+                # fractions and exponents, rounded as before
+                number = Decimal(value.replace(',', '.'))
+                number = int(number.to_integral_value('ROUND_HALF_UP'))
+    except (ValueError, ArithmeticError):
+        return None
+    if number < 0:
+        return None
 
+    result = []
+    for system in quantities['numbers']['units'].values:
+        if system == identifier and type(value) is str:
+            result.append(value)  # as typed
+        else:
+            result.append(int_to_text(number, base_of(system)))
     return result
 
 
 def convert_fuel(identifier: str,
                  value: Decimal | str,
-                 quantize: str,
+                 quantize: Decimal,
                  scientific: int) -> list[str] | None:
 
     try:
@@ -915,7 +1383,7 @@ def convert_fuel(identifier: str,
 
 def convert_wave(index: int,
                  value: Decimal | str,
-                 quantize: str,
+                 quantize: Decimal,
                  scientific: int) -> list[str] | None:
 
     try:
@@ -929,9 +1397,7 @@ def convert_wave(index: int,
     if v <= 0:
         return ['0'] * len(units)
 
-    unit = units[index]
-
-    ratio, pattern = unit[1], unit[2]
+    ratio, pattern = units.values[index], units.sections[index]
 
     # base value
     if pattern in (0, 1):
@@ -943,8 +1409,7 @@ def convert_wave(index: int,
         hertz = SL / meters
 
     result = []
-    for unit in units:
-        ratio, pattern = unit[1], unit[2]
+    for ratio, pattern in zip(units.values, units.sections):
         if pattern in (0, 1):
             # frequency
             r = hertz / ratio
@@ -959,19 +1424,43 @@ def convert_wave(index: int,
 # ------------------------------------------------------------------------------
 
 
-def value_processing(value: Decimal, quantize: str, scientific: int) -> str:
+quanta = {}
+
+
+def quantum(quantize: int) -> Decimal:
+    q = quanta.get(quantize)
+    if q is None:
+        q = quanta[quantize] = Decimal(f'{0:.{quantize}f}')
+    return q
+
+
+def value_processing(value: Decimal,
+                     quantize: Decimal,
+                     scientific: int) -> str:
+    if not processing_cache.size:
+        return format_value(value, quantize, scientific)
+
+    # hashing a string is much cheaper than hashing a new Decimal,
+    # the result depends on the context precision, see quantize()
+    key = (str(value), quantize, scientific, getcontext().prec)
+    text = processing_cache.get(key)
+    if text is None:
+        text = format_value(value, quantize, scientific)
+        processing_cache.put(key, text)
+    return text
+
+
+def format_value(value: Decimal, quantize: Decimal, scientific: int) -> str:
     try:
-        value = value.quantize(Decimal(quantize))
+        value = value.quantize(quantize)
     except BaseException:
         pass  # todo: error?
     value = value.normalize()
+    text = str(value)
 
-    exponent = value.as_tuple().exponent
-    digits = len(value.as_tuple().digits)
-
-    if isinstance(exponent, int) and exponent > 0:
-        if digits + exponent < scientific:
-            if value == value.to_integral_value():  # check
-                value = Decimal(int(value))
+    # only a positive exponent is written as E+, the value is an integer
+    # then: digits + exponent is adjusted() + 1, no digit tuple is made
+    if 'E+' in text and value.adjusted() + 1 < scientific:
+        return str(int(value))
 
-    return str(value)
+    return text
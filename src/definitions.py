@@ -0,0 +1,383 @@
+# definitions.py
+#
+# Copyright 2025-2026 Golodnikov Sergey
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+# units and quantities of the user and the site, read from TOML or JSON
+# at startup, important: must not import gi
+#
+#   [quantities.flow]
+#   title = "Flow rate"
+#
+#   [[units]]
+#   quantity = "flow"
+#   title = "Cubic meter per hour, m^3/h"
+#   value = "1"
+#
+#   [[units]]
+#   quantity = "length"
+#   title = "Rod (plant), prd"
+#   value = "5.0292"
+#   unit = "m"  # the value is in this unit, the base unit if omitted
+#   section = "Plant units"  # optional, as are system, derived and hint
+
+from decimal import Context, Decimal, DecimalException, localcontext
+import json
+import marshal
+import os
+import re
+
+try:
+    import tomllib  # Python 3.11
+except ImportError:
+    tomllib = None
+
+from . import convertidor
+from .convertidor import N_, Registry, SPECIAL, quantities, unit_symbol
+
+
+ENVIRONMENT = 'CONVERTIDOR_UNITS'  # more files, separated by os.pathsep
+NAMES = ('units.toml', 'units.json')
+CACHE = 1  # format of the compiled definitions, see load()
+
+ICON = 'applications-engineering-symbolic'  # of the quantities added
+SECTION = N_('User-defined units')
+SYSTEMS = ('', 'imperial', 'legacy')  # shown with these units, see main.py
+
+KEY = re.compile(r'[a-z][a-z0-9_]*\Z')
+
+UNIT_FIELDS = frozenset(('quantity', 'title', 'value', 'unit',
+                         'section', 'system', 'derived', 'hint'))
+QUANTITY_FIELDS = frozenset(('title', 'icon'))
+
+loaded = False  # a worker process started by spawn loads them again
+
+
+class DefinitionError(ValueError):
+    pass
+
+
+def paths() -> list[str]:
+    # the site first, a later file replaces the units of the same title
+    config_dirs = os.environ.get('XDG_CONFIG_DIRS') or '/etc/xdg'
+    config_home = (os.environ.get('XDG_CONFIG_HOME') or
+                   os.path.join(os.path.expanduser('~'), '.config'))
+    directories = [d for d in reversed(config_dirs.split(os.pathsep)) if d]
+    directories.append(config_home)
+    found = [os.path.join(d, 'convertidor', name)
+             for d in directories for name in NAMES]
+    found = [p for p in found if os.path.isfile(p)]
+    found.extend(p for p in os.environ.get(ENVIRONMENT, '').split(os.pathsep)
+                 if p)
+    return found
+
+
+def read(path: str) -> dict:
+    with open(path, 'rb') as f:
+        data = f.read()
+    try:
+        if path.endswith('.toml'):
+            if tomllib is None:
+                raise DefinitionError('TOML needs Python 3.11, use JSON')
+            document = tomllib.loads(data.decode('utf-8'))
+        else:
+            document = json.loads(data)
+    except (ValueError, UnicodeDecodeError) as err:
+        raise DefinitionError(str(err))
+    if not isinstance(document, dict):
+        raise DefinitionError('not a table of quantities and units')
+    return document
+
+
+# ------------------------------------------------------------------------------
+
+
+class Quantity:
+    # the units of one quantity, built-in and defined, while loading
+
+    __slots__ = ('key', 'title', 'icon', 'pattern', 'sections', 'count',
+                 'base', 'units', 'names', 'symbols')
+
+    def __init__(self, key: str, title: str | None, icon: str):
+        self.key = key
+        self.title = title  # None: a built-in quantity
+        self.icon = icon
+        self.pattern = []  # (title, system) of the sections added
+        self.sections = {}  # (title, system): index
+        self.count = 0  # sections
+        self.base = frozenset()  # titles of the built-in units
+        self.units = {}  # title: unit tuple, in the order of definition
+        self.names = {}  # lower case title: ratio
+        self.symbols = {}  # symbol: [ratio, ...]
+        if title is None:
+            built = quantities[key]
+            self.sections = {p: i for i, p in enumerate(built['pattern'])}
+            self.count = len(built['pattern'])
+            units = built['units']
+            for title, value in zip(units.titles, units.values):
+                self.names.setdefault(title.lower(), value)
+                self.symbols.setdefault(unit_symbol(title), []).append(value)
+            self.base = frozenset(units.titles)
+
+    def ratio(self, unit: str) -> Decimal:
+        # a title or an unambiguous symbol, as in batch.unit_index()
+        value = self.names.get(unit.lower())
+        if value is not None:
+            return value
+        found = self.symbols.get(unit, ())
+        if len(found) == 1:
+            return found[0]
+        if found:
+            raise DefinitionError(f'ambiguous unit "{unit}"')
+        raise DefinitionError(f'unknown unit "{unit}"')
+
+    def section(self, title: str, system: str) -> int:
+        index = self.sections.get((title, system))
+        if index is None:
+            index = self.sections[(title, system)] = self.count
+            self.count += 1
+            self.pattern.append((title, system))
+        return index
+
+    def add(self, definition: dict):
+        fields = definition.keys() - UNIT_FIELDS
+        if fields:
+            raise DefinitionError(f'unknown field "{min(fields)}"')
+        title = text_field(definition, 'title')
+        if not title:
+            raise DefinitionError('missing "title"')
+        if title in self.base:
+            raise DefinitionError(f'"{title}" is a built-in unit')
+        value = number(definition.get('value'))
+        unit = text_field(definition, 'unit')
+        if unit:
+            value *= self.ratio(unit)
+        system = text_field(definition, 'system')
+        if system not in SYSTEMS:
+            raise DefinitionError(f'unknown system "{system}"')
+        derived = definition.get('derived', False)
+        if type(derived) is not bool:
+            raise DefinitionError('"derived" must be true or false')
+        section = self.section(text_field(definition, 'section') or SECTION,
+                               system)
+        symbol = unit_symbol(title)
+        replaced = self.units.pop(title, None)  # placed at the end
+        if replaced is not None:
+            self.symbols[symbol].remove(replaced[1])
+        self.units[title] = (title, value, section, derived,
+                             text_field(definition, 'hint'))
+        self.names[title.lower()] = value
+        self.symbols.setdefault(symbol, []).append(value)
+
+    def compiled(self) -> tuple:
+        # the parallel arrays of Units, the ratios as text
+        units = self.units.values()
+        if self.title is not None and not units:
+            raise DefinitionError('no units')
+        return (self.key, self.title, self.icon, tuple(self.pattern),
+                tuple(u[0] for u in units),
+                tuple(str(u[1]) for u in units),
+                tuple(u[2] for u in units),
+                tuple(u[3] for u in units),
+                tuple(u[4] for u in units))
+
+
+def text_field(definition: dict, name: str) -> str:
+    value = definition.get(name, '')
+    if type(value) is not str:
+        raise DefinitionError(f'"{name}" must be a string')
+    return value.strip()
+
+
+def number(value) -> Decimal:
+    # a string keeps every digit, "1/60" is a quotient; floats and
+    # integers are read as written
+    if type(value) is int or type(value) is float:
+        value = repr(value)
+    if type(value) is not str:
+        raise DefinitionError('"value" must be a number or a string')
+    try:
+        numerator, _, denominator = value.partition('/')
+        result = Decimal(numerator.strip())
+        if denominator:
+            result /= Decimal(denominator.strip())
+    except (DecimalException, ArithmeticError):
+        raise DefinitionError(f'invalid value "{value}"')
+    if not result.is_finite() or result <= 0:
+        raise DefinitionError(f'the value must be positive: "{value}"')
+    return result
+
+
+# ------------------------------------------------------------------------------
+
+
+def compile_files(files: list[str]) -> tuple[list, list[str]]:
+    # validated, a unit or a quantity with an error is left out
+    errors = []
+    defined = {}  # key: Quantity
+
+    def quantity_of(key: str, location: str) -> Quantity | None:
+        q = defined.get(key)
+        if q is None:
+            if key not in quantities:
+                errors.append(f'{location}: unknown quantity "{key}"')
+            elif key in SPECIAL:
+                errors.append(f'{location}: units can not be added '
+                              f'to "{key}"')
+            else:
+                q = defined[key] = Quantity(key, None, '')
+        return q
+
+    # the ratios with the precision of the built-in ones
+    with localcontext(Context(prec=Registry.PRECISION)):
+        for path in files:
+            try:
+                document = read(path)
+            except (OSError, DefinitionError) as err:
+                errors.append(f'{path}: {err}')
+                continue
+
+            table = document.get('quantities', {})
+            if not isinstance(table, dict):
+                errors.append(f'{path}: "quantities" must be a table')
+                table = {}
+            for key, definition in table.items():
+                location = f'{path}: quantities.{key}'
+                try:
+                    if not KEY.match(key):
+                        raise DefinitionError('the key must be a-z, 0-9, _')
+                    if key in quantities or key in defined:
+                        raise DefinitionError('already defined')
+                    if not isinstance(definition, dict):
+                        raise DefinitionError('must be a table')
+                    fields = definition.keys() - QUANTITY_FIELDS
+                    if fields:
+                        raise DefinitionError(
+                            f'unknown field "{min(fields)}"')
+                    title = text_field(definition, 'title')
+                    if not title:
+                        raise DefinitionError('missing "title"')
+                except DefinitionError as err:
+                    errors.append(f'{location}: {err}')
+                    continue
+                defined[key] = Quantity(
+                    key, title, text_field(definition, 'icon') or ICON)
+
+            units = document.get('units', [])
+            if not isinstance(units, list):
+                errors.append(f'{path}: "units" must be a list')
+                units = []
+            for i, definition in enumerate(units):
+                location = f'{path}: units[{i}]'
+                if not isinstance(definition, dict):
+                    errors.append(f'{location}: must be a table')
+                    continue
+                key = definition.get('quantity')
+                if type(key) is not str:
+                    errors.append(f'{location}: missing "quantity"')
+                    continue
+                q = quantity_of(key, location)
+                if q is None:
+                    continue
+                try:
+                    q.add(definition)
+                except DefinitionError as err:
+                    errors.append(f'{location}: {err}')
+
+    tables = []
+    for key, q in defined.items():
+        try:
+            tables.append(q.compiled())
+        except DefinitionError as err:
+            errors.append(f'quantities.{key}: {err}')
+    return tables, errors
+
+
+def merge(tables: list):
+    # the units are made when the quantity is built, as the built-in ones
+    for key, title, icon, pattern, *arrays in tables:
+        if title is None:
+            quantities.extend(key, extension(pattern, *arrays))
+        else:
+            quantities.add(key, title, builder(pattern, *arrays), icon)
+
+
+def extension(pattern: tuple, titles, values, sections, derived, hints):
+    return lambda: (pattern, tuple(zip(titles, map(Decimal, values),
+                                       sections, derived, hints)))
+
+
+def builder(pattern: tuple, *arrays):
+    units = extension(pattern, *arrays)
+    return lambda: {'pattern': pattern, 'units': units()[1]}
+
+
+# ------------------------------------------------------------------------------
+
+
+def cache_path() -> str:
+    cache_home = (os.environ.get('XDG_CACHE_HOME') or
+                  os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(cache_home, 'convertidor', 'units.cache')
+
+
+def signature(files: list[str]) -> tuple:
+    # the built-in units and the loader are checked as well: a title,
+    # a ratio or a rule of the validation may change
+    found = []
+    for path in [convertidor.__file__, __file__] + files:
+        try:
+            stat = os.stat(path)
+            found.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            found.append((path, -1, -1))
+    return (CACHE, marshal.version, tuple(found))
+
+
+def load(files: list[str] | None = None) -> list[str]:
+    # merges the definitions into the registry, the errors are returned;
+    # parsing and validation take much longer than the conversions of a
+    # session, the result is kept until one of the files changes
+    global loaded
+    loaded = True
+    if files is None:
+        files = paths()
+    if not files:
+        return []
+
+    key = signature(files)
+    path = cache_path()
+    try:
+        with open(path, 'rb') as f:
+            # loads() of the whole file, load() reads it in small pieces
+            cached, tables, errors = marshal.loads(f.read())
+        if cached != key:
+            raise ValueError('outdated')
+    except (OSError, ValueError, EOFError, TypeError):
+        tables, errors = compile_files(files)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temporary = f'{path}.{os.getpid()}'
+            with open(temporary, 'wb') as f:
+                f.write(marshal.dumps((key, tuple(tables), tuple(errors))))
+            os.replace(temporary, path)
+        except OSError:
+            pass  # read again next time
+
+    merge(tables)
+    return list(errors)
@@ -0,0 +1,298 @@
+# expression.py
+#
+# Copyright 2025-2026 Golodnikov Sergey
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+# arithmetic with unit suffixes in the entries, such as "3 ft + 7 in",
+# important: must not import gi
+
+from decimal import Context, Decimal, DecimalException, localcontext
+import operator
+import re
+
+from .convertidor import Cache, MATRIX_GUARD, SL, quantities
+
+
+NUMBER = re.compile(r'(?:\d+(?:[.,]\d*)?|[.,]\d+)(?:[eE][+-]?\d+)?')
+EXPONENT = 3  # characters read past a number: "e+5" may extend it
+OPERATORS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '^': operator.pow,
+}
+
+# token kinds
+NUM = 0
+OP = 1
+UNIT = 2
+
+ZERO = Decimal(0)
+
+compiled = Cache(256)  # (quantity, index, text): evaluate()
+
+
+class ExpressionError(ValueError):
+    pass
+
+
+class Tokenizer:
+    # the tokens of the last text are kept: while typing, only the tokens
+    # from the edited one on are read again
+
+    def __init__(self):
+        self.key = None
+        self.text = ''
+        self.tokens = []  # (kind, value, start, end)
+
+    def tokenize(self, text: str, key, symbols: tuple) -> list:
+        tokens = []
+        if key == self.key:
+            same = 0
+            for a, b in zip(text, self.text):
+                if a != b:
+                    break
+                same += 1
+            # a token depends on the characters after it: 2eV -> 2e5,
+            # 12 -> 123, a longer unit symbol; those within that reach
+            # of the change are read again
+            reach = EXPONENT
+            if symbols:
+                reach = max(reach, len(symbols[0][0]) + 1)
+            for token in self.tokens:
+                if token[3] + reach > same:
+                    break
+                tokens.append(token)
+        start = tokens[-1][3] if tokens else 0
+        tokens.extend(scan(text, start, symbols,
+                           tokens[-1] if tokens else None))
+        self.key, self.text, self.tokens = key, text, tokens
+        return tokens
+
+
+def scan(text: str, position: int, symbols: tuple, previous) -> list:
+    # symbols: the longest first, a unit may only follow a number or ")"
+    tokens = []
+    length = len(text)
+    while True:
+        while position < length and text[position].isspace():
+            position += 1
+        if position == length:
+            return tokens
+        token = None
+        if previous is not None and (previous[0] == NUM or
+                                     previous[1] == ')'):
+            for symbol, index in symbols:
+                end = position + len(symbol)
+                if (text.startswith(symbol, position) and
+                        not (end < length and text[end].isalnum())):
+                    token = (UNIT, index, position, end)
+                    break
+        if token is None:
+            m = NUMBER.match(text, position)
+            if m is not None:
+                token = (NUM, Decimal(m.group().replace(',', '.')),
+                         position, m.end())
+            elif text.startswith('**', position):
+                token = (OP, '^', position, position + 2)
+            elif text[position] in '+-*/^()':
+                token = (OP, text[position], position, position + 1)
+            else:
+                raise ExpressionError(f'unexpected "{text[position]}"')
+        tokens.append(token)
+        previous = token
+        position = token[3]
+
+
+# ------------------------------------------------------------------------------
+
+
+class Parser:
+    # recursive descent, every rule returns a closure:
+    #   sum:     product (("+" | "-") product)*
+    #   product: unary (("*" | "/") unary)*
+    #   unary:   ("+" | "-") unary | power
+    #   power:   atom ("^" unary)?
+    #   atom:    (NUMBER | "(" sum ")") UNIT?
+
+    def __init__(self, tokens: list, ratio):
+        self.tokens = tokens
+        self.position = 0
+        self.ratio = ratio  # unit index: factor to the unit of the entry
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def take(self, *operators):
+        token = self.peek()
+        if token is not None and token[0] == OP and token[1] in operators:
+            self.position += 1
+            return token[1]
+        return None
+
+    def parse(self):
+        node = self.sum()
+        token = self.peek()
+        if token is not None:
+            raise ExpressionError(f'unexpected "{token[1]}"')
+        return node
+
+    def sum(self):
+        node = self.product()
+        while (symbol := self.take('+', '-')) is not None:
+            node = binary(OPERATORS[symbol], node, self.product())
+        return node
+
+    def product(self):
+        node = self.unary()
+        while (symbol := self.take('*', '/')) is not None:
+            node = binary(OPERATORS[symbol], node, self.unary())
+        return node
+
+    def unary(self):
+        symbol = self.take('+', '-')
+        if symbol == '-':
+            a = self.unary()
+            return lambda: -a()
+        if symbol == '+':
+            return self.unary()
+        return self.power()
+
+    def power(self):
+        node = self.atom()
+        if self.take('^') is not None:
+            node = binary(operator.pow, node, self.unary())
+        return node
+
+    def atom(self):
+        token = self.peek()
+        if token is None:
+            raise ExpressionError('unexpected end')
+        if token[0] == NUM:
+            self.position += 1
+            value = token[1]
+            node = lambda: value
+        elif self.take('(') is not None:
+            node = self.sum()
+            if self.take(')') is None:
+                raise ExpressionError('missing ")"')
+        else:
+            raise ExpressionError(f'unexpected "{token[1]}"')
+        token = self.peek()
+        if token is not None and token[0] == UNIT:
+            self.position += 1
+            node = self.ratio(token[1], node)
+        return node
+
+
+def binary(function, a, b):
+    return lambda: function(a(), b())
+
+
+# ------------------------------------------------------------------------------
+
+
+tokenizer = Tokenizer()
+symbols_sorted = {}  # quantity: ((symbol, index), ...), the longest first
+
+
+def unit_symbols(quantity: str) -> tuple:
+    symbols = symbols_sorted.get(quantity)
+    if symbols is None:
+        _, found = quantities[quantity]['units'].indexes()
+        # an ambiguous symbol is the first unit with it
+        symbols = tuple(sorted(((s, i[0]) for s, i in found.items()),
+                               key=lambda s: -len(s[0])))
+        symbols_sorted[quantity] = symbols
+    return symbols
+
+
+def compile_text(text: str, quantity: str, index: int):
+    # a function that evaluates the text in the unit of the entry,
+    # under the current Decimal context
+    key = (quantity, index, text)
+    function = compiled.get(key)
+    if function is not None:
+        return function
+
+    units = quantities[quantity]['units']
+    values = units.values
+
+    def ratio(source: int, node):
+        if source == index:
+            return node
+        s, t = values[source], values[index]
+        if type(s) is str or type(t) is str:  # not a linear quantity
+            raise ExpressionError('units can not be mixed here')
+        if quantity == 'wave':
+            # a wavelength is the inverse of a frequency, as in
+            # convert_wave()
+            a, b = units.sections[source] > 1, units.sections[index] > 1
+            if a != b:
+                return lambda: SL / (node() * s) / t
+        return lambda: node() * s / t
+
+    tokens = tokenizer.tokenize(text, quantity, unit_symbols(quantity))
+    if not tokens:
+        raise ExpressionError('empty expression')
+    function = Parser(tokens, ratio).parse()
+    compiled.put(key, function)
+    return function
+
+
+def evaluate(text: str, quantity: str, index: int, precision: int) -> Decimal:
+    # guard digits as in conversion_matrix(), the conversion rounds;
+    # the parser and the closures recurse: "((((1" or 1+1+...+1 nested
+    # beyond the recursion limit is not an expression
+    try:
+        function = compile_text(text, quantity, index)
+    except RecursionError:
+        raise ExpressionError('too deeply nested')
+    with localcontext(Context(prec=precision + MATRIX_GUARD)):
+        try:
+            result = function()
+        except (DecimalException, ZeroDivisionError, OverflowError):
+            raise ExpressionError('not a number')
+        except RecursionError:
+            raise ExpressionError('too deeply nested')
+        if not result.is_finite():
+            raise ExpressionError('not a finite number')
+        return +result
+
+
+def value_of(text: str,
+             quantity: str,
+             index: int,
+             precision: int) -> tuple[Decimal | str, int | None] | None:
+    # the value of an entry: a number with its exponent, the result of
+    # an expression, or the text itself (digits of a numeral system)
+    try:
+        decimal = Decimal(text.replace(',', '.').strip() or '0')
+    except DecimalException:
+        try:
+            decimal = evaluate(text, quantity, index, precision)
+        except (ExpressionError, KeyError):
+            return text.strip(), None
+        return max(decimal, ZERO), None  # not adjusted by +/-
+    exponent = decimal.as_tuple().exponent
+    if type(exponent) is not int:
+        return None  # NaN or Infinity: nothing to convert
+    return max(decimal, ZERO), exponent
@@ -18,19 +18,58 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from gettext import gettext as _
+import os
 import sys
+import time
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, Gio, Adw, Gdk, GLib
 
-from .convertidor import quantities, conversion
-from .window import ConvertidorWindow
+from . import convertidor
+from .convertidor import (
+    quantities,
+    conversion,
+    conversion_series,
+    series_split,
+)
+from .definitions import load
+from .expression import value_of
+from .profiler import profiler
+from .search import Index
+from .table import EXTENSIONS, format_of, serialize
+from .window import ConvertidorWindow, UnitItem, UnitRow
 
 
 APP_VERSION = '1.4.2'
 
+DEBOUNCE = 60  # ms, keystrokes within this window are recalculated once
+
+PROFILE_REFRESH = 500  # ms, timing overlay
+
+
+def conversion_profiled(*args):
+    start = time.perf_counter()
+    with profiler.span('conversion'):
+        result = conversion(*args)
+    profiler.collect('value_processing', start)
+    return result
+
+
+def series_conversion(quantity, index, values, *args):
+    # the columns as the text of the views, joined in the worker
+    start = time.perf_counter()
+    try:
+        with profiler.span('series_conversion'):
+            columns = conversion_series(quantity, index, values, *args)
+            return ['\n'.join(c) for c in columns]
+    finally:
+        # formatting of the series, not of the next single value
+        profiler.collect('value_processing', start, 'series_processing')
+
 
 class ConvertidorApplication(Adw.Application):
 
@@ -43,13 +82,24 @@ class ConvertidorApplication(Adw.Application):
         self.create_action('preferences',
                            self.preferences_action,
                            ['<primary>p'])
+        self.create_action('search', self.search_action, ['<primary>f'])
+        self.create_action('copy-table', self.copy_table_action, None, 's')
+        self.set_accels_for_action('app.copy-table::tsv',
+                                   ['<primary><shift>c'])
+        self.create_action('export-table',
+                           self.export_table_action,
+                           ['<primary>e'])
 
     def do_activate(self):
+        # a second launch only raises the window, the setup below runs
+        # once per window
+        if self.props.active_window:
+            self.props.active_window.present()
+            return
+
         self.pref = Gio.Settings.new('tech.digiroad.Convertidor')
 
-        self.w = self.props.active_window
-        if not self.w:
-            self.w = ConvertidorWindow(application=self)
+        self.w = ConvertidorWindow(application=self)
         self.w.set_default_size(self.pref.get_int('width'),
                                 self.pref.get_int('height'))
         self.w.present()
@@ -57,46 +107,74 @@ class ConvertidorApplication(Adw.Application):
         if self.pref.get_boolean('maximized'):
             self.w.maximize()
 
-        user_theme = self.pref.get_boolean('theme-user')
-        if not user_theme:
-            theme = self.get_system_color_scheme()
-            self.pref.set_int('theme', theme)
-            self.update_theme(theme)
-        else:
-            self.update_theme(self.pref.get_int('theme'))
+        # the stored theme is applied at once, the system one follows
+        self.update_theme(self.pref.get_int('theme'))
+        if not self.pref.get_boolean('theme-user'):
+            self.get_system_color_scheme()
 
         self.clipboard = Gdk.Display().get_default().get_clipboard()
 
         self.css_provider = Gtk.CssProvider()
-
-        self.structure = (
-            (self.w.label_cero, self.w.units_cero, []),
-            (self.w.label_uno, self.w.units_uno, []),
-            (self.w.label_dos, self.w.units_dos, []),
-            (self.w.label_tres, self.w.units_tres, []),
+        Gtk.StyleContext.add_provider_for_display(
+            Gdk.Display.get_default(),
+            self.css_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
         )
 
-        self.filling, self.entries, self.derived = [], [], []
+        # units: store of the quantity -> sections -> filter -> list view,
+        # only the visible rows are realized and they are recycled
+        self.store = None
+        self.pages = {}  # key: store
+        self.results = {}  # key: last result of the page, see table()
+        self.bound = {}  # item: row
+
+        self.units_sorted = Gtk.SortListModel(
+            section_sorter=Gtk.NumericSorter(
+                expression=Gtk.PropertyExpression.new(
+                    UnitItem, None, 'section')))
+        self.units_filter = Gtk.CustomFilter.new(self.unit_visible)
+        self.units_filtered = Gtk.FilterListModel(model=self.units_sorted,
+                                                  filter=self.units_filter)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self.row_setup)
+        factory.connect('bind', self.row_bind)
+        factory.connect('unbind', self.row_unbind)
+
+        header_factory = Gtk.SignalListItemFactory()
+        header_factory.connect('setup', self.header_setup)
+        header_factory.connect('bind', self.header_bind)
+
+        self.w.units.set_model(Gtk.NoSelection(model=self.units_filtered))
+        self.w.units.set_factory(factory)
+        self.w.units.set_header_factory(header_factory)
 
         self.freeze = False
         self.recent_quantity = (-1, '', [])  # index, key, pattern
 
+        # recalculation: debounced, in a worker thread, newest keystroke wins
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.generation = 0
+        self.debounce = 0  # GLib source
+        self.future = None
+        convertidor.exact_mode = self.pref.get_boolean('exact')
+
+        # timings of the hot paths: CONVERTIDOR_PROFILE=1 or the hidden key
+        if self.pref.get_boolean('profile'):
+            profiler.enabled = True
+        if profiler.enabled:
+            self.profile_start()
+
+        # unit search, the index is built on the first query
+        self.search_index = None
+        self.w.search.connect('search-changed', self.search_changed)
+        self.w.search.connect('activate', self.search_activate)
+        self.w.search_results.connect('row-activated', self.search_chosen)
+
         self.w.pref_theme.connect('notify::selected-item', self.theme_change)
         self.w.button_reset.connect('clicked', self.entries_reset_wrapper)
 
-        if self.pref.get_int('theme') == 0:
-            err_color = 'color: #660000;}'
-        else:
-            err_color = 'color: #ff8080;}'
-        css = (
-            '.hint-constant {'
-            'opacity: 0.4; transition: opacity 0.4s;} '
-            '.hint-constant:hover {'
-            'opacity: 1.0;} '
-            '.css-error {'
-            f'{err_color}'
-        )
-        self.set_css(css)
+        self.update_css(self.pref.get_int('theme'))
 
         # displaying derived units of measurement
         self.show_derived = self.pref.get_boolean('derived')
@@ -111,20 +189,58 @@ class ConvertidorApplication(Adw.Application):
         self.w.show_legacy.set_active(self.show_legacy)
         self.w.show_legacy.connect('toggled', self.state_legacy)
 
-        # initialization
-        recent_index = self.pref.get_int('quantity')
-        recent_ar = self.w.quantities_list.get_row_at_index(recent_index)
-        self.quantities_choice(None, recent_ar)
-        self.w.quantities_list.select_row(recent_ar)
-        self.w.quantities_list.connect('row-selected', self.quantities_choice)
+        # the first frame is drawn before the quantities and the units,
+        # an idle callback runs after the redraw
+        self.w.get_frame_clock().connect('after-paint', self.first_frame)
+        GLib.idle_add(self.populate)
+
+    def first_frame(self, clock):
+        clock.disconnect_by_func(self.first_frame)
+        if profiler.enabled:
+            # origin: the launcher, before GTK is imported
+            now = time.perf_counter()
+            profiler.record('first_frame', profiler.origin, now)
+            ms = (now - profiler.origin) * 1000
+            print(f'Startup: first frame after {ms:.1f} ms', file=sys.stderr)
+
+    def populate(self):
+        if self.w.quantities_list.get_row_at_index(0) is not None:
+            return GLib.SOURCE_REMOVE  # already populated
+        with profiler.span('populate'):
+            self.w.quantities_populate()
+            # the key, the index only of an older version: the index of a
+            # user-defined quantity moves when the definitions change
+            keys = list(quantities)
+            recent = self.pref.get_string('quantity-key')
+            if recent in quantities:
+                recent_index = keys.index(recent)
+            else:
+                recent_index = min(max(self.pref.get_int('quantity'), 0),
+                                   len(keys) - 1)
+            recent_ar = self.w.quantities_list.get_row_at_index(recent_index)
+            self.quantities_choice(None, recent_ar)
+            self.w.quantities_list.select_row(recent_ar)
+            self.w.quantities_list.connect('row-selected',
+                                           self.quantities_choice)
+        return GLib.SOURCE_REMOVE
 
     def set_css(self, css: str):
         self.css_provider.load_from_data(css.encode('utf-8'), len(css))
-        Gtk.StyleContext.add_provider_for_display(
-            Gdk.Display.get_default(),
-            self.css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+
+    def update_css(self, theme: int):
+        if theme == 0:
+            err_color = 'color: #660000;}'
+        else:
+            err_color = 'color: #ff8080;}'
+        css = (
+            '.hint-constant {'
+            'opacity: 0.4; transition: opacity 0.4s;} '
+            '.hint-constant:hover {'
+            'opacity: 1.0;} '
+            '.css-error {'
+            f'{err_color}'
         )
+        self.set_css(css)
 
     def quantities_choice(self, _, ar):
         index = ar.get_index()
@@ -133,147 +249,302 @@ class ConvertidorApplication(Adw.Application):
         key = ar.get_name()
         self.recent_quantity = (index, key, quantities[key]['pattern'])
         self.pref.set_int('quantity', index)
-
-        # clear, todo: check
-        for element in self.structure:
-            for unit in element[2]:
-                unit[0].remove(unit[1])
-                element[1].remove(unit[0])
-            element[1].remove_all()
-            element[2].clear()
-
-        self.filling.clear()
-        self.entries.clear()
-        self.derived.clear()
-
-        # fill
-        for index, unit in enumerate(quantities[key]['units']):
-
-            header = Gtk.Box(orientation='horizontal', hexpand=True)
-            label = Gtk.Label(halign='start', hexpand=True, label=unit[0])
-            header.append(label)
-
-            if len(unit) > 4:  # hint, constant
-                hint = Gtk.Image.new_from_icon_name('hint-symbolic')
-                hint.set_tooltip_markup(unit[4])
-                hint.add_css_class('hint-constant')
-                header.append(hint)
-
-            cell = Gtk.Box(orientation='vertical', hexpand=True)
-            cell.append(header)
-
-            cell.set_margin_top(2)
-            cell.set_margin_bottom(2)
-            cell.set_margin_start(2)
-            cell.set_margin_end(2)
-
-            wrapper = Gtk.Box(margin_top=4)
-            wrapper.add_css_class('linked')
-
-            entry = Gtk.Entry(
-                hexpand=True,
-                input_purpose='digits',
-                name=str(index),
-                # text='0',
-            )
-            entry.set_size_request(190, -1)
-
-            increment = Gtk.Button(icon_name='plus-symbolic')
-            decrement = Gtk.Button(icon_name='minus-symbolic')
-            copy = Gtk.Button(icon_name='copy-symbolic')
-
-            entry.connect('changed', self.entry_changed, key)
-            increment.connect('clicked', self.entry_increment, entry)
-            decrement.connect('clicked', self.entry_decrement, entry)
-            copy.connect('clicked', self.entry_copy, entry)
-
-            wrapper.append(entry)
-            wrapper.append(increment)
-            wrapper.append(decrement)
-            wrapper.append(copy)
-
-            cell.append(wrapper)
-
-            derived = False
-            if len(unit) > 3:  # optional parameter, derived
-                derived = unit[3]
-
-            self.filling.append((unit[2], cell, wrapper, derived))
-            self.entries.append(entry)
-
-        self.fill()
-        self.visibility()
-
-    def entries_reset(self, skip_name: str = ''):
+        self.pref.set_string('quantity-key', key)
+        self.recalculation_cancel()
+
+        # the units of a quantity are built once and reused
+        with profiler.span('quantities_choice'):
+            store = self.pages.get(key)
+            if store is None:
+                with profiler.span('page_build'):
+                    store = self.pages[key] = self.page_build(key)
+            self.store = store
+            self.units_sorted.set_model(store)  # filtered with the new pattern
+
+    def page_build(self, key: str) -> Gio.ListStore:
+        store = Gio.ListStore(item_type=UnitItem)
+        units = quantities[key]['units']
+        for index, (title, section, derived, hint) in enumerate(zip(
+                units.titles, units.sections, units.derived, units.hints)):
+            store.append(UnitItem(
+                index=index,
+                title=title,
+                section=section,
+                derived=derived,
+                hint=hint,  # hint, constant
+            ))
+        return store
+
+    def row_setup(self, _, list_item):
+        row = UnitRow()
+        row.entry.connect('changed', self.entry_changed)
+        row.increment.connect('clicked', self.entry_increment, row.entry)
+        row.decrement.connect('clicked', self.entry_decrement, row.entry)
+        row.copy.connect('clicked', self.entry_copy, row.entry)
+        list_item.set_activatable(False)
+        list_item.set_focusable(False)
+        list_item.set_child(row)
+
+    def row_bind(self, _, list_item):
+        row, item = list_item.get_child(), list_item.get_item()
+        self.freeze = True
+        row.bind(item)
+        self.freeze = False
+        self.bound[item] = row
+
+    def row_unbind(self, _, list_item):
+        row, item = list_item.get_child(), list_item.get_item()
+        if self.bound.get(item) is row:
+            del self.bound[item]
+        row.unbind()
+
+    def header_setup(self, _, list_header):
+        label = Gtk.Label(halign='start', css_classes=['title-4'])
+        label.set_margin_top(12)
+        label.set_margin_bottom(4)
+        list_header.set_child(label)
+
+    def header_bind(self, _, list_header):
+        section = list_header.get_item().section
+        list_header.get_child().set_text(
+            _(self.recent_quantity[2][section][0]))
+
+    def unit_visible(self, item) -> bool:
+        if item.derived and not self.show_derived:
+            return False
+        match self.recent_quantity[2][item.section][1]:
+            case 'imperial':
+                return self.show_imperial
+            case 'legacy':
+                return self.show_legacy
+        return True
+
+    def entries_reset(self, skip_index: int = -1):
+        self.recalculation_cancel()
+        if self.store is None:
+            return  # not populated yet
         self.freeze = True
-        for i in self.entries:
-            if i.get_name() != skip_name:
-                i.set_text('')
+        for item in self.store:
+            if item.index != skip_index:
+                item.text = ''
+                row = self.bound.get(item)
+                if row is not None:
+                    row.entry.set_text('')
         self.freeze = False
+        self.series_clear()
+        self.results.pop(self.recent_quantity[1], None)
 
     def entries_reset_wrapper(self, _):
         self.entries_reset()
-        for element in self.structure:
-            element[1].unselect_all()
         self.w.overlay.add_toast(Adw.Toast(title=self.w.ts_reset, timeout=2))
 
     def entry_get(self, entry) -> tuple[Decimal | str, int | None] | None:
         try:
-            text = entry.get_text().replace(',', '.').strip()
-            if text == '':
-                text = '0'
-            decimal = Decimal(text)
-            exponent = decimal.as_tuple().exponent
-            if type(exponent) is not int:
-                return None  # todo: think about it
-            return max(decimal, Decimal('0')), exponent
+            return value_of(entry.get_text(),
+                            self.recent_quantity[1],
+                            int(entry.get_name()),
+                            self.pref.get_int('precision'))
         except BaseException:
-            try:
-                return entry.get_text().strip(), None
-            except BaseException:
-                GLib.idle_add(self.entries_reset, entry.get_name())
-                return None
+            GLib.idle_add(self.entries_reset, int(entry.get_name()))
+            return None
 
-    def entry_changed(self, entry, quantity):
+    def entry_changed(self, entry):
         if self.freeze:
             return
 
-        entry_index = entry.get_name()
+        index = int(entry.get_name())
+        self.store.get_item(index).text = entry.get_text()
 
-        value = self.entry_get(entry)
+        texts = series_split(entry.get_text())
+        if texts is not None:
+            self.series_changed(index, texts)
+            return
+
+        with profiler.span('entry_get'):
+            if self.recent_quantity[1] == 'numbers':
+                # digits of any numeral system, not a Decimal
+                value = (entry.get_text().strip() or '0', None)
+            else:
+                value = self.entry_get(entry)
         if value is None:
+            # an earlier keystroke still pending would bring its table back
+            self.recalculation_cancel()
+            self.results.pop(self.recent_quantity[1], None)
             return
 
-        result = conversion(quantity,
-                            int(entry_index),
-                            value[0],
-                            self.pref.get_int('precision'),
-                            self.pref.get_int('quantize'),
-                            self.pref.get_int('scientific'))
+        self.recalculation_cancel()
+        self.debounce = GLib.timeout_add(DEBOUNCE,
+                                         self.recalculate,
+                                         index,
+                                         self.recent_quantity[1],
+                                         value[0],
+                                         self.generation)
+
+    def recalculation_cancel(self):
+        # results of earlier keystrokes are stale from now on
+        self.generation += 1
+        if self.debounce:
+            GLib.source_remove(self.debounce)
+            self.debounce = 0
+        if self.future is not None:
+            self.future.cancel()  # if not started yet
+            self.future = None
+
+    def recalculate(self, index, quantity, value, generation):
+        self.debounce = 0
+        work = conversion_profiled if profiler.enabled else conversion
+        self.future = self.executor.submit(work,
+                                           quantity,
+                                           index,
+                                           value,
+                                           self.pref.get_int('precision'),
+                                           self.pref.get_int('quantize'),
+                                           self.pref.get_int('scientific'))
+        self.future.add_done_callback(
+            lambda future: GLib.idle_add(self.recalculated,
+                                         future,
+                                         index,
+                                         generation))
+        return GLib.SOURCE_REMOVE
+
+    def recalculated(self, future, index, generation):
+        if generation != self.generation or future.cancelled():
+            return GLib.SOURCE_REMOVE
+        self.future = None
 
-        sc = entry.get_style_context()
+        try:
+            result = future.result()
+        except BaseException as exception:
+            print('Error:', str(exception))
+            result = None
+
+        with profiler.span('entries_update'):
+            self.entries_update(index, result)
+        return GLib.SOURCE_REMOVE
+
+    def entries_update(self, index, result):
+        source = self.store.get_item(index)
 
         if result is None:
-            if not sc.has_class('css-error'):
-                entry.add_css_class('css-error')
+            self.unit_error(source, True)
+            # no table of an earlier value for Copy and Export
+            self.results.pop(self.recent_quantity[1], None)
             return
+        self.unit_error(source, False)
+        self.series_clear()
+        self.results[self.recent_quantity[1]] = ('value', result)
+
+        # item.text is the last rendered string: only changed values are
+        # set, and only rows that are bound (visible) touch an entry,
+        # hidden rows pick up the text when they are bound again
+        self.freeze = True
+        for item, text in zip(self.store, result):
+            if item.index == index:
+                continue
+            if item.error:
+                self.unit_error(item, False)
+            if item.text == text:
+                continue
+            item.text = text
+            row = self.bound.get(item)
+            if row is not None:
+                row.entry.set_text(text)
+        self.freeze = False
+
+    def unit_error(self, item, state: bool):
+        if item.error != state:
+            item.error = state
+            row = self.bound.get(item)
+            if row is not None:
+                row.set_error(state)
+
+    # series: a pasted column of values, converted in one call and shown
+    # as a column under every other unit
+
+    def series_changed(self, index, texts):
+        quantity = self.recent_quantity[1]
+        precision = self.pref.get_int('precision')
+        with profiler.span('series_parse'):
+            if quantity == 'numbers':
+                values = texts
+            else:
+                values = [value_of(t, quantity, index, precision)
+                          for t in texts]
+                values = [v[0] if v is not None else None for v in values]
+
+        self.recalculation_cancel()
+        self.debounce = GLib.timeout_add(DEBOUNCE,
+                                         self.series_recalculate,
+                                         index,
+                                         quantity,
+                                         values,
+                                         self.generation)
+
+    def series_recalculate(self, index, quantity, values, generation):
+        self.debounce = 0
+        self.future = self.executor.submit(series_conversion,
+                                           quantity,
+                                           index,
+                                           values,
+                                           self.pref.get_int('precision'),
+                                           self.pref.get_int('quantize'),
+                                           self.pref.get_int('scientific'))
+        self.future.add_done_callback(
+            lambda future: GLib.idle_add(self.series_recalculated,
+                                         future,
+                                         index,
+                                         generation))
+        return GLib.SOURCE_REMOVE
+
+    def series_recalculated(self, future, index, generation):
+        if generation != self.generation or future.cancelled():
+            return GLib.SOURCE_REMOVE
+        self.future = None
 
-        if sc.has_class('css-error'):
-            entry.remove_css_class('css-error')
+        try:
+            columns = future.result()
+        except BaseException as exception:
+            print('Error:', str(exception))
+            columns = None
+
+        with profiler.span('series_update'):
+            self.series_update(index, columns)
+        return GLib.SOURCE_REMOVE
+
+    def series_update(self, index, columns):
+        source = self.store.get_item(index)
+        self.unit_error(source, columns is None)
+        if columns is None:
+            self.results.pop(self.recent_quantity[1], None)
+            return
+        self.results[self.recent_quantity[1]] = ('series', columns)
 
+        # the entries of the other units are emptied, the column is shown
+        # by the bound rows and picked up by the others when bound
         self.freeze = True
-        for i in self.entries:
-            index = int(i.get_name())
-            if index != int(entry_index):
-                try:
-                    i.set_text(result[index])
-                    sc = i.get_style_context()
-                    if sc.has_class('css-error'):
-                        i.remove_css_class('css-error')
-                except BaseException as exception:
-                    print('Error:', str(exception))
+        for item, column in zip(self.store, columns):
+            if item.index == index:
+                column = ''
+            elif item.text:
+                item.text = ''
+            if item.error:
+                self.unit_error(item, False)
+            item.series = column
+            row = self.bound.get(item)
+            if row is not None:
+                if item.index != index:
+                    row.entry.set_text('')
+                row.set_series(column)
         self.freeze = False
 
+    def series_clear(self):
+        for item in self.store:
+            if item.series:
+                item.series = ''
+                row = self.bound.get(item)
+                if row is not None:
+                    row.set_series('')
+
     def adjust_entry(self, entry, delta):
         value = self.entry_get(entry)
         if value is not None:
@@ -286,7 +557,7 @@ class ConvertidorApplication(Adw.Application):
                         d = Decimal.max(d, Decimal('0'))
                     entry.set_text(str(d))
                     self.freeze = False
-                    self.entry_changed(entry, self.recent_quantity[1])
+                    self.entry_changed(entry)
 
     def entry_increment(self, _, entry):
         self.adjust_entry(entry, 1)
@@ -294,61 +565,185 @@ class ConvertidorApplication(Adw.Application):
     def entry_decrement(self, _, entry):
         self.adjust_entry(entry, -1)
 
+    def table(self) -> tuple[list, list]:
+        # the units on the page and the last result, the entries are not
+        # read: with a series they only hold the pasted text
+        items = [self.units_filtered.get_item(position)
+                 for position in range(self.units_filtered.get_n_items())]
+        titles = [_(item.title) for item in items]
+        kind, result = self.results.get(self.recent_quantity[1],
+                                        ('value', None))
+        if kind == 'series':
+            columns = [result[item.index].split('\n') for item in items]
+            return titles, list(zip(*columns))
+        return [_('Unit'), _('Value')], [
+            [title, result[item.index] if result else '']
+            for title, item in zip(titles, items)]
+
+    def copy_table_action(self, action, parameter):
+        with profiler.span('table'):
+            text = serialize(parameter.get_string(), *self.table())
+        self.clipboard.set(text)
+        self.w.overlay.add_toast(Adw.Toast(title=self.w.ts_table_copy,
+                                           timeout=2))
+
+    def export_table_action(self, *args):
+        dialog = Gtk.FileDialog(
+            initial_name=self.recent_quantity[1] + EXTENSIONS['csv'])
+        dialog.save(self.w, None, self.export_table_save)
+
+    def export_table_save(self, dialog, task):
+        try:
+            path = dialog.save_finish(task).get_path()
+        except GLib.Error:
+            return  # dismissed
+        try:
+            with profiler.span('table'):
+                text = serialize(format_of(path), *self.table())
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+        except OSError as err:
+            title = str(err)
+        else:
+            title = self.w.ts_table_export
+        self.w.overlay.add_toast(Adw.Toast(title=title, timeout=2))
+
     def entry_copy(self, _, entry):
-        self.clipboard.set(entry.get_text())
+        item = self.store.get_item(int(entry.get_name()))
+        self.clipboard.set(item.series or entry.get_text())
         self.w.overlay.add_toast(Adw.Toast(title=self.w.ts_copy, timeout=2))
 
-    def fill(self):
-        # clear
-        for element in self.structure:
-            element[1].remove_all()
-            element[2].clear()
-        # fill
-        for i in self.filling:
-            pattern, cell, wrapper, derived = i
-            if derived and not self.show_derived:
-                continue
-            self.structure[pattern][1].insert(cell, -1)
-            self.structure[pattern][2].append((cell, wrapper))
-
-    def visibility(self):
-        pattern = [None, None, None, None]  # cero, uno, dos, tres
-
-        for i, j in enumerate(self.recent_quantity[2]):
-            if j[1] == 'imperial' and not self.show_imperial:
-                pattern[i] = None
-            elif j[1] == 'legacy' and not self.show_legacy:
-                pattern[i] = None
+    def visibility(self, state: bool):
+        # units are filtered, not rebuilt
+        with profiler.span('visibility'):
+            if state:
+                self.units_filter.changed(Gtk.FilterChange.LESS_STRICT)
             else:
-                pattern[i] = j[0]
-
-        for i, j in enumerate(pattern):
-            if j is not None:
-                self.structure[i][0].set_text(j)
-                self.structure[i][0].set_visible(True)
-                self.structure[i][1].set_visible(True)
-            else:
-                self.structure[i][0].set_text('')
-                self.structure[i][0].set_visible(False)
-                self.structure[i][1].set_visible(False)
+                self.units_filter.changed(Gtk.FilterChange.MORE_STRICT)
+
+    def search_action(self, *args):
+        self.w.split_view.set_show_content(False)  # if collapsed
+        self.w.search.grab_focus()
+
+    def search_changed(self, entry):
+        query = entry.get_text()
+        with profiler.span('search'):
+            if self.search_index is None:
+                self.search_index = Index(_)
+            matches = self.search_index.search(query)
+
+        self.w.search_results.remove_all()
+        for quantity, index, title in matches:
+            ar = Adw.ActionRow(name=f'{quantity}/{index}',
+                               title=title,
+                               subtitle=_(quantities.title(quantity)),
+                               use_markup=False,
+                               activatable=True)
+            self.w.search_results.append(ar)
+        self.w.sidebar_stack.set_visible_child_name(
+            'results' if query.strip() else 'quantities')
+
+    def search_activate(self, _):
+        ar = self.w.search_results.get_row_at_index(0)
+        if ar is not None:
+            self.unit_show(ar.get_name())
+
+    def search_chosen(self, _, ar):
+        self.unit_show(ar.get_name())
+
+    def unit_show(self, name: str):
+        quantity, index = name.split('/')
+        index = int(index)
+        ar = self.w.quantities_list.get_row_at_index(
+            list(quantities).index(quantity))
+        self.w.quantities_list.select_row(ar)  # quantities_choice()
+        item = self.store.get_item(index)
+
+        # a unit hidden by the toggles is shown
+        if not self.unit_visible(item):
+            if item.derived:
+                self.w.show_derived.set_active(True)
+            match self.recent_quantity[2][item.section][1]:
+                case 'imperial':
+                    self.w.show_imperial.set_active(True)
+                case 'legacy':
+                    self.w.show_legacy.set_active(True)
+
+        for position in range(self.units_filtered.get_n_items()):
+            if self.units_filtered.get_item(position) is item:
+                self.w.split_view.set_show_content(True)
+                self.w.units.scroll_to(position, Gtk.ListScrollFlags.NONE,
+                                       None)
+                GLib.idle_add(self.unit_focus, item)
+                break
+
+    def unit_focus(self, item):
+        row = self.bound.get(item)  # bound by scroll_to()
+        if row is not None:
+            row.entry.grab_focus()
+        return GLib.SOURCE_REMOVE
+
+    def profile_start(self):
+        # value_processing is called once per unit, the sum per keystroke
+        # is recorded by conversion_profiled()
+        convertidor.value_processing = profiler.accumulate(
+            'value_processing', convertidor.value_processing)
+
+        # relayout and painting, to compare with the Decimal arithmetic
+        self.frame_start = 0.0
+        clock = self.w.get_frame_clock()
+        clock.connect('before-paint', self.profile_frame_start)
+        clock.connect('after-paint', self.profile_frame_end)
+
+        self.create_action('profile-dump',
+                           self.profile_dump_action,
+                           ['<primary><shift>t'])
+
+        self.w.profile.set_visible(True)
+        GLib.timeout_add(PROFILE_REFRESH, self.profile_update)
+
+    def profile_frame_start(self, _):
+        self.frame_start = time.perf_counter()
+
+    def profile_frame_end(self, _):
+        profiler.record('frame', self.frame_start, time.perf_counter())
+
+    def profile_update(self):
+        text = profiler.summary()
+        if self.w.profile.get_text() != text:
+            self.w.profile.set_text(text)
+        return GLib.SOURCE_CONTINUE
+
+    def profile_path(self) -> str:
+        return os.environ.get('CONVERTIDOR_TRACE') or os.path.join(
+            GLib.get_user_cache_dir(), 'convertidor', 'trace.json')
+
+    def profile_dump_action(self, *args):
+        path = self.profile_path()
+        try:
+            profiler.dump(path)
+        except OSError as err:
+            print('Error:', str(err))
+            return
+        self.w.overlay.add_toast(Adw.Toast(title=path, timeout=4))
 
     def state_derived(self, toggle_button):
         state = toggle_button.get_active()
         self.show_derived = state
         self.pref.set_boolean('derived', state)
-        self.fill()
+        self.visibility(state)
 
     def state_imperial(self, toggle_button):
         state = toggle_button.get_active()
         self.show_imperial = state
         self.pref.set_boolean('imperial', state)
-        self.visibility()
+        self.visibility(state)
 
     def state_legacy(self, toggle_button):
         state = toggle_button.get_active()
         self.show_legacy = state
         self.pref.set_boolean('legacy', state)
-        self.visibility()
+        self.visibility(state)
 
     def about_action(self, *args):
         about = Adw.AboutDialog(
@@ -374,6 +769,7 @@ class ConvertidorApplication(Adw.Application):
         self.w.pref_precision.set_value(self.pref.get_int('precision'))
         self.w.pref_quantize.set_value(self.pref.get_int('quantize'))
         self.w.pref_scientific.set_value(self.pref.get_int('scientific'))
+        self.w.pref_exact.set_active(self.pref.get_boolean('exact'))
         self.w.pref_dialog.connect('closed', self.preferences_save)
         self.w.pref_dialog.present(self.props.active_window)
 
@@ -386,9 +782,13 @@ class ConvertidorApplication(Adw.Application):
                           int(self.w.pref_quantize.get_value()))
         self.pref.set_int('scientific',
                           int(self.w.pref_scientific.get_value()))
+        self.pref.set_boolean('exact', self.w.pref_exact.get_active())
+        convertidor.exact_mode = self.pref.get_boolean('exact')
 
-    def create_action(self, name, callback, shortcuts=None):
-        action = Gio.SimpleAction.new(name, None)
+    def create_action(self, name, callback, shortcuts=None, parameter=None):
+        # parameter: a GVariant type string, such as 's'
+        action = Gio.SimpleAction.new(
+            name, GLib.VariantType.new(parameter) if parameter else None)
         action.connect('activate', callback)
         self.add_action(action)
         if shortcuts:
@@ -405,27 +805,59 @@ class ConvertidorApplication(Adw.Application):
         else:
             style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
 
-    def get_system_color_scheme(self) -> int:
-        bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
-        proxy = Gio.DBusProxy.new_sync(
-            bus,
-            Gio.DBusProxyFlags.NONE,
+    def get_system_color_scheme(self):
+        # asynchronous, the main loop is not blocked by the portal
+        Gio.DBusProxy.new_for_bus(
+            Gio.BusType.SESSION,
+            Gio.DBusProxyFlags.DO_NOT_LOAD_PROPERTIES |
+            Gio.DBusProxyFlags.DO_NOT_CONNECT_SIGNALS,
             None,
             'org.freedesktop.portal.Desktop',
             '/org/freedesktop/portal/desktop',
             'org.freedesktop.portal.Settings',
             None,
+            self.system_color_scheme_proxy,
         )
+
+    def system_color_scheme_proxy(self, _, task):
+        try:
+            proxy = Gio.DBusProxy.new_for_bus_finish(task)
+        except GLib.Error:
+            self.system_color_scheme(2)
+            return
+        proxy.call('Read',
+                   GLib.Variant('(ss)', ('org.freedesktop.appearance',
+                                         'color-scheme')),
+                   Gio.DBusCallFlags.NONE,
+                   -1,
+                   None,
+                   self.system_color_scheme_read)
+
+    def system_color_scheme_read(self, proxy, task):
         try:
-            scheme = proxy.Read('(ss)',
-                                'org.freedesktop.appearance',
-                                'color-scheme')
-        except Exception:
+            scheme = proxy.call_finish(task).unpack()[0]
+        except GLib.Error:
             scheme = 2
+        self.system_color_scheme(scheme)
+
+    def system_color_scheme(self, scheme):
         # note, scheme: 1 = Dark, 2 = Light
-        return 1 if scheme == 1 else 0
+        theme = 1 if scheme == 1 else 0
+        if self.pref.get_boolean('theme-user'):
+            return  # changed by the user in the meantime
+        if theme != self.pref.get_int('theme'):
+            self.pref.set_int('theme', theme)
+            self.update_theme(theme)
+            self.update_css(theme)
 
     def do_shutdown(self):
+        self.recalculation_cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if profiler.enabled:
+            try:
+                profiler.dump(self.profile_path())
+            except OSError as err:
+                print('Error:', str(err))
         if self.w.is_maximized():
             self.pref.set_boolean('maximized', True)
         else:
@@ -437,5 +869,8 @@ class ConvertidorApplication(Adw.Application):
 
 
 def main(version):
+    # before the window lists the quantities
+    for error in load():
+        print('Warning: ' + error, file=sys.stderr)
     app = ConvertidorApplication()
     return app.run(sys.argv)
@@ -0,0 +1,120 @@
+# profiler.py
+#
+# Copyright 2025-2026 Golodnikov Sergey
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+# opt-in timing of the hot paths, important: must not import gi
+
+from collections import defaultdict, deque
+from contextlib import contextmanager
+import json
+import os
+import threading
+import time
+
+
+ENVIRONMENT = 'CONVERTIDOR_PROFILE'
+
+WINDOW = 200  # samples per name for the rolling percentiles
+EVENTS = 100000  # trace events kept in memory
+
+
+class Profiler:
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.samples = defaultdict(lambda: deque(maxlen=WINDOW))
+        self.events = deque(maxlen=EVENTS)
+        self.totals = defaultdict(float)  # accumulated, see collect()
+
+    def record(self, name: str, start: float, end: float):
+        # seconds, time.perf_counter()
+        if not self.enabled:
+            return
+        self.samples[name].append(end - start)
+        self.events.append((name,
+                            threading.get_ident(),
+                            start - self.origin,
+                            end - start))
+
+    @contextmanager
+    def span(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def accumulate(self, name: str, function):
+        # wraps a function called many times per span,
+        # the sum is recorded by collect()
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.totals[name] += time.perf_counter() - start
+        return wrapper
+
+    def collect(self, name: str, start: float, sample: str | None = None):
+        # sample: recorded under another name, the totals are reset anyway
+        total = self.totals.pop(name, None)
+        if total is not None:  # not called, e.g. a cached result
+            self.record(sample or name, start, start + total)
+
+    def percentiles(self, name: str) -> tuple[float, float, float] | None:
+        samples = sorted(self.samples.get(name, ()))
+        if not samples:
+            return None
+        n = len(samples) - 1
+        return (samples[n // 2],
+                samples[round(n * 0.95)],
+                samples[round(n * 0.99)])
+
+    def summary(self) -> str:
+        lines = [f'{"":18}{"p50":>8}{"p95":>8}{"p99":>8}  ms']
+        for name in sorted(self.samples):
+            p = self.percentiles(name)
+            if p is not None:
+                lines.append(f'{name:18}' +
+                             ''.join(f'{v * 1000:8.2f}' for v in p))
+        return '\n'.join(lines)
+
+    def dump(self, path: str):
+        # Trace Event Format, opens in about:tracing and Perfetto
+        events = [{
+            'name': name,
+            'ph': 'X',
+            'pid': os.getpid(),
+            'tid': tid,
+            'ts': start * 1e6,
+            'dur': duration * 1e6,
+        } for name, tid, start, duration in list(self.events)]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events,
+                       'displayTimeUnit': 'ms'}, f)
+
+
+profiler = Profiler(bool(os.environ.get(ENVIRONMENT)))
@@ -0,0 +1,379 @@
+# radix.py
+#
+# Copyright 2025-2026 Golodnikov Sergey
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+# numeral systems of integers of any size, important: must not import gi
+
+from decimal import Context, Decimal, Inexact, localcontext
+import base64
+import decimal
+import math
+import sys
+
+
+DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'  # base 32: 0-9A-V
+BASE64 = ('ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+          'abcdefghijklmnopqrstuvwxyz'
+          '0123456789+/')  # RFC 4648, A is 0
+
+BASES = {
+    'decimal': 10,
+    'hexadecimal': 16,
+    'octal': 8,
+    'binary': 2,
+    'base32': 32,
+    'base36': 36,
+    'base64': 64,
+}
+
+# below sys.int_max_str_digits, int() and str() are used as they are
+SMALL = 2048  # digits
+LEAF = 128  # bits, Decimal(int) of the leaves
+TABLE = 65536  # strings of digit groups, other radices
+
+SEPARATORS = str.maketrans('', '', ' \t\r\n_')
+
+CHUNK = 1 << 20  # bytes read at a time by the streaming conversion
+
+
+def base_of(identifier: str) -> int:
+    # 'decimal', 'base36', 'base7' ...
+    base = BASES.get(identifier)
+    if base is None and identifier.startswith('base'):
+        base = int(identifier[4:])
+        if not 2 <= base <= 36:
+            raise ValueError(f'radix out of range: {base}')
+    if base is None:
+        raise ValueError(f'unknown numeral system: {identifier}')
+    return base
+
+
+def exact() -> Context:
+    return Context(prec=decimal.MAX_PREC,
+                   Emax=decimal.MAX_EMAX,
+                   Emin=decimal.MIN_EMIN,
+                   traps=[Inexact])
+
+
+# ------------------------------------------------------------------------------
+
+
+def text_to_int(text: str, base: int) -> int:
+    text = text.translate(SEPARATORS)
+    if text == '' or not text.isascii():
+        raise ValueError('not a number')
+
+    if base == 64:
+        if '=' in text:
+            raise ValueError('not a number')
+        # whole groups of 4 digits are 3 bytes
+        text = 'A' * (-len(text) % 4) + text
+        try:
+            data = base64.b64decode(text, validate=True)
+        except ValueError:
+            raise ValueError('not a number')
+        return int.from_bytes(data, 'big')
+
+    if not text.isalnum():  # no signs or points
+        raise ValueError('not a number')
+    if base & (base - 1) == 0 or len(text) <= SMALL:
+        return int(text, base)  # linear for the powers of two
+    return text_to_int_split(text, base)
+
+
+def text_to_int_split(text: str, base: int) -> int:
+    # halves: high * base**len(low) + low, subquadratic multiplication,
+    # the pieces are below the limit of int()
+    powers = {}
+
+    def power(k: int) -> int:
+        p = powers.get(k)
+        if p is None:
+            p = powers[k] = base ** k
+        return p
+
+    def inner(a: int, b: int) -> int:
+        if b - a <= SMALL:
+            return int(text[a:b], base)
+        middle = (a + b + 1) >> 1
+        return inner(a, middle) * power(b - middle) + inner(middle, b)
+
+    return inner(0, len(text))
+
+
+# ------------------------------------------------------------------------------
+
+
+def int_to_text(n: int, base: int) -> str:
+    if n < 0:
+        raise ValueError('negative number')
+    match base:
+        case 2:
+            return format(n, 'b')
+        case 8:
+            return format(n, 'o')
+        case 16:
+            return format(n, 'X')
+        case 32:
+            # 5 bytes are 8 digits of the extended hex alphabet
+            return bytes_digits(n, 5, base64.b32hexencode, '0')
+        case 64:
+            # 3 bytes are 4 digits
+            return bytes_digits(n, 3, base64.b64encode, 'A')
+        case 10:
+            if n.bit_length() <= SMALL * 3:
+                return str(n)
+            return str(int_to_decimal(n))
+    if not 2 <= base <= 36:
+        raise ValueError(f'radix out of range: {base}')
+    return int_to_text_split(n, base)
+
+
+def bytes_digits(n: int, group: int, encode, zero: str) -> str:
+    size = max(1, (n.bit_length() + 7) // 8)
+    size += -size % group
+    text = encode(n.to_bytes(size, 'big')).decode('ascii')
+    return text.lstrip(zero) or zero
+
+
+def int_to_decimal(n: int) -> Decimal:
+    # halves: high * 2**bits + low, the multiplication of libmpdec
+    # is subquadratic, the context is exact
+    powers = {}
+    two = Decimal(2)
+
+    def power(w: int) -> Decimal:
+        p = powers.get(w)
+        if p is None:
+            if w <= LEAF:
+                p = two ** w
+            else:
+                w2 = w >> 1
+                p = power(w2) * power(w - w2)
+            powers[w] = p
+        return p
+
+    def inner(n: int, w: int) -> Decimal:
+        if w <= LEAF:
+            return Decimal(n)
+        w2 = w >> 1
+        high = n >> w2
+        low = n - (high << w2)
+        return inner(high, w - w2) * power(w2) + inner(low, w2)
+
+    with localcontext(exact()):
+        return inner(n, n.bit_length())
+
+
+tables = {}
+
+
+def digit_groups(base: int) -> tuple[int, int, list[str]]:
+    # the strings of all groups of w digits, built once
+    t = tables.get(base)
+    if t is None:
+        w = int(math.log(TABLE, base))
+        table = ['']
+        for _ in range(w):
+            table = [t + d for t in table for d in DIGITS[:base]]
+        t = tables[base] = (w, base ** w, table)
+    return t
+
+
+def int_to_text_split(n: int, base: int) -> str:
+    # exact Decimal division of the halves, k: digits of the result
+    powers = {}
+    powers_int = {}
+    b = Decimal(base)
+
+    def power(k: int) -> Decimal:
+        p = powers.get(k)
+        if p is None:
+            p = powers[k] = b ** k
+        return p
+
+    def power_int(k: int) -> int:
+        p = powers_int.get(k)
+        if p is None:
+            p = powers_int[k] = base ** k
+        return p
+
+    w, group, table = digit_groups(base)
+
+    def small(n: int, k: int) -> str:
+        # int division is quadratic, but fast for short numbers
+        if k <= w * 4:
+            groups = []
+            for _ in range(-(-k // w)):
+                n, g = divmod(n, group)
+                groups.append(table[g])
+            return ''.join(reversed(groups))[-k:]
+        k2 = k >> 1
+        high, low = divmod(n, power_int(k2))
+        return small(high, k - k2) + small(low, k2)
+
+    def inner(d: Decimal, k: int) -> str:
+        if k <= SMALL:
+            return small(int(d), k)
+        k2 = k >> 1
+        high, low = divmod(d, power(k2))
+        return inner(high, k - k2) + inner(low, k2)
+
+    if n < base:
+        return DIGITS[n]
+    k = int(n.bit_length() / math.log2(base)) + 2  # n < base**k
+    if k <= SMALL:
+        text = small(n, k)
+    else:
+        with localcontext(exact()):
+            text = inner(int_to_decimal(n), k)
+    return text.lstrip('0') or '0'
+
+
+# ------------------------------------------------------------------------------
+
+
+# streaming: between powers of two every group of digits maps to a group
+# of digits on its own, the memory used does not depend on the input size
+
+
+def bits_of(base: int) -> int:
+    if base < 2 or base > 64 or base & (base - 1):
+        raise ValueError(f'streaming needs a power of two radix: {base}')
+    return base.bit_length() - 1
+
+
+def digits(stream, chunk: int = CHUNK):
+    # bytes without separators, stream: a binary file
+    while True:
+        data = stream.read(chunk)
+        if not data:
+            break
+        yield data.translate(None, b' \t\r\n_')
+
+
+def significant(stream, zero: bytes, chunk: int = CHUNK) -> tuple[int, int]:
+    # digits without the leading zeros, the leading zeros
+    total = leading = 0
+    found = False
+    for data in digits(stream, chunk):
+        if not found:
+            stripped = data.lstrip(zero)
+            leading += len(data) - len(stripped)
+            found = stripped != b''
+            data = stripped
+        total += len(data)
+    return total, leading
+
+
+def convert_stream(source, target, base_from: int, base_to: int,
+                   chunk: int = CHUNK) -> int:
+    # source: a seekable binary file, target: a text file or anything
+    # with write(str), returns the number of digits written
+    bits = bits_of(base_from), bits_of(base_to)
+    group = math.lcm(*bits) // bits[0]  # input digits of a whole group
+    zero_from = (BASE64 if base_from == 64 else DIGITS)[0]
+    zero_to = (BASE64 if base_to == 64 else DIGITS)[0]
+
+    source.seek(0)
+    total, leading = significant(source, zero_from.encode(), chunk)
+    if total == 0:
+        target.write(zero_to)
+        return 1
+
+    source.seek(0)
+    position = written = 0
+    pending = b''
+    for data in digits(source, chunk):
+        if leading:
+            skip = min(leading, len(data))
+            data = data[skip:]
+            leading -= skip
+        pending += data
+        # a piece ends where the remaining digits are whole groups
+        first = (total - position) % group
+        if len(pending) < first:
+            continue
+        take = len(pending) - (len(pending) - first) % group
+        if take == 0:
+            continue
+        piece, pending = pending[:take], pending[take:]
+        try:
+            n = text_to_int(piece.decode('ascii'), base_from)
+        except (ValueError, UnicodeDecodeError):
+            raise ValueError(f'not a digit of base {base_from} '
+                             f'near digit {position + 1}')
+        text = int_to_text(n, base_to)
+        if position:  # whole groups, the zeros are significant
+            text = text.rjust(len(piece) * bits[0] // bits[1], zero_to)
+        target.write(text)
+        position += take
+        written += len(text)
+    return written
+
+
+def main(argv: list[str]) -> int:
+    # only the command line needs them, not the conversion
+    import argparse
+    import shutil
+    import tempfile
+
+    parser = argparse.ArgumentParser(
+        prog='convertidor --radix',
+        description='Convert a large number between binary, octal, '
+                    'hexadecimal, base 32 and base 64 in constant memory.',
+    )
+    parser.add_argument('-f', '--from', dest='source', required=True,
+                        help='numeral system: name or radix')
+    parser.add_argument('-t', '--to', dest='target', required=True,
+                        help='numeral system: name or radix')
+    parser.add_argument('-i', '--input', default='-',
+                        help='input file (default: stdin)')
+    parser.add_argument('-o', '--output', default='-',
+                        help='output file (default: stdout)')
+    args = parser.parse_args(argv)
+
+    try:
+        bases = [int(b) if b.isdigit() else base_of(b)
+                 for b in (args.source, args.target)]
+        for b in bases:
+            bits_of(b)
+    except ValueError as err:
+        parser.error(str(err))
+
+    if args.input == '-':
+        # two passes: stdin is kept in a temporary file
+        src = tempfile.TemporaryFile()
+        shutil.copyfileobj(sys.stdin.buffer, src, CHUNK)
+    else:
+        src = open(args.input, 'rb')
+    dst = sys.stdout if args.output == '-' else open(
+        args.output, 'w', encoding='ascii')
+
+    try:
+        convert_stream(src, dst, bases[0], bases[1])
+        dst.write('\n')
+    except ValueError as err:
+        print('Error: ' + str(err), file=sys.stderr)
+        return 1
+    finally:
+        src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    return 0
@@ -0,0 +1,172 @@
+# search.py
+#
+# Copyright 2025-2026 Golodnikov Sergey
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+# unit search over all quantities, important: must not import gi
+
+from collections import Counter
+import heapq
+import re
+
+from .convertidor import quantities, unit_symbol
+
+
+LIMIT = 20  # matches returned
+
+# term kinds, a lower rank is a better match
+SYMBOL = 0
+WORD = 2
+NAME = 3  # the unit after the name of a group: "Wavelength, foot"
+EXACT = 0  # the whole term was typed
+PREFIX = 1
+TYPO = 4  # one edit away, see Node.fuzzy()
+
+WORDS = re.compile(r'[^\s,()]+')
+
+
+class Node:
+    # trie node, postings: (kind, length, quantity, index) of every term
+    # passing through this node
+
+    __slots__ = ('children', 'postings')
+
+    def __init__(self):
+        self.children = {}
+        self.postings = []
+
+    def add(self, term: str, posting: tuple):
+        node = self
+        for c in term:
+            node = node.children.setdefault(c, Node())
+            node.postings.append(posting)
+
+    def find(self, prefix: str):
+        node = self
+        for c in prefix:
+            node = node.children.get(c)
+            if node is None:
+                return None
+        return node
+
+    def fuzzy(self, token: str, i: int, budget: int, found: list):
+        # prefixes within one edit of the token
+        if i == len(token):
+            found.append(self)
+            return
+        c = token[i]
+        child = self.children.get(c)
+        if child is not None:
+            child.fuzzy(token, i + 1, budget, found)
+        if not budget:
+            return
+        self.fuzzy(token, i + 1, 0, found)  # an extra character
+        for k, child in self.children.items():
+            if k != c:
+                child.fuzzy(token, i + 1, 0, found)  # a wrong character
+            child.fuzzy(token, i, 0, found)  # a missing character
+        if i + 1 < len(token):  # two characters swapped
+            child = self.children.get(token[i + 1])
+            if child is not None:
+                child = child.children.get(c)
+                if child is not None:
+                    child.fuzzy(token, i + 2, 0, found)
+
+
+class Index:
+
+    def __init__(self, translate=None):
+        # translate: gettext, translated titles are found as well
+        self.root = Node()
+        self.titles = {}  # (quantity, index): displayed title
+        for quantity in quantities:
+            units = quantities[quantity]['units']
+            # a name before the comma shared by several units is a group,
+            # what follows it is not a symbol
+            groups = Counter(t.rsplit(', ', 1)[0] for t in units.titles)
+            for index, title in enumerate(units.titles):
+                unit = (quantity, index)
+                shown = translate(title) if translate else title
+                self.titles[unit] = shown
+                group = groups[title.rsplit(', ', 1)[0]] > 1
+                kind = NAME if group else SYMBOL
+                for text in {title, shown}:
+                    self.add_title(text, unit, kind)
+
+    def add_title(self, title: str, unit: tuple, kind: int = SYMBOL):
+        terms = {}
+        if ', ' in title:
+            symbol = unit_symbol(title).lower()
+            if kind == SYMBOL:
+                terms[symbol] = SYMBOL
+            else:  # the words of the unit name, "foot (US)"
+                for word in WORDS.findall(symbol):
+                    terms[word] = kind
+        for word in WORDS.findall(title.lower()):
+            terms.setdefault(word, WORD)
+        for term, kind in terms.items():
+            self.root.add(term, (kind, len(term)) + unit)
+
+    def token_matches(self, token: str) -> dict:
+        # unit: best rank of the token
+        matches = {}
+
+        def collect(node, typo: int):
+            for kind, length, *unit in node.postings:
+                rank = kind + typo + (EXACT if length == len(token)
+                                      else PREFIX)
+                unit = tuple(unit)
+                if rank < matches.get(unit, 99):
+                    matches[unit] = rank
+
+        node = self.root.find(token)
+        if node is not None:
+            collect(node, 0)
+        elif len(token) >= 3:
+            found = []
+            self.root.fuzzy(token, 0, 1, found)
+            for node in found:
+                collect(node, TYPO)
+        return matches
+
+    def search(self, query: str, limit: int = LIMIT) -> list[tuple]:
+        # [(quantity, index, title), ...], the best first
+        tokens = query.lower().split()
+        if not tokens:
+            return []
+        ranks = None
+        for token in tokens:
+            matches = self.token_matches(token)
+            if ranks is None:
+                ranks = matches
+            else:  # every token must match
+                ranks = {u: r + matches[u] for u, r in ranks.items()
+                         if u in matches}
+            if not ranks:
+                return []
+        # the unit named by the query first: Foot before Cubic foot,
+        # then the same symbol case: kWh before KWH
+        lower = query.lower()
+        best = heapq.nsmallest(
+            limit, ranks.items(),
+            key=lambda m: (m[1],
+                           not self.titles[m[0]].lower().startswith(lower),
+                           query not in self.titles[m[0]],
+                           len(self.titles[m[0]]),
+                           m[0]))
+        return [(q, i, self.titles[(q, i)]) for (q, i), _ in best]
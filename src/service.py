@@ -0,0 +1,294 @@
+# service.py
+#
+# Copyright 2025-2026 Golodnikov Sergey
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+# JSON-RPC 2.0 over a Unix socket, one message per line,
+# important: must not import gi
+
+from decimal import Decimal
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+
+from .batch import (
+    PRECISION,
+    QUANTIZE,
+    SCIENTIFIC,
+    unit_index,
+    convert_values,
+)
+from .convertidor import quantities, conversion, conversion_cache
+from .definitions import load
+
+
+LIMIT = 16 * 1024 * 1024  # bytes, the longest line (batch) accepted
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RequestError(Exception):
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def socket_path() -> str:
+    runtime = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime:
+        return os.path.join(runtime, 'convertidor.sock')
+    return f'/tmp/convertidor-{os.getuid()}.sock'
+
+
+def warm_up(precision: int):
+    # the registry and the matrices are built before the first request
+    for q in quantities:
+        conversion(q, 0, Decimal(1), precision, QUANTIZE, SCIENTIFIC)
+
+
+# ------------------------------------------------------------------------------
+
+
+def method_quantities(params) -> list:
+    return [{'key': q, 'title': quantities.title(q)} for q in quantities]
+
+
+def method_units(params) -> list:
+    units = quantities[param_quantity(params)]['units']
+    return [{'index': i,
+             'title': title,
+             'identifier': value if type(value) is str else None}
+            for i, (title, value) in enumerate(zip(units.titles,
+                                                   units.values))]
+
+
+def method_convert(params) -> list:
+    quantity = param_quantity(params)
+    try:
+        source = unit_index(quantity, str(params['from']))
+        targets = params.get('to')
+        if targets is None:
+            targets = list(range(len(quantities[quantity]['units'])))
+        else:
+            if isinstance(targets, (str, int)):
+                targets = [targets]
+            targets = [unit_index(quantity, str(t)) for t in targets]
+    except KeyError:
+        raise RequestError(INVALID_PARAMS, 'missing parameter "from"')
+    except ValueError as err:
+        raise RequestError(INVALID_PARAMS, str(err))
+
+    values = params.get('values')
+    if values is None:
+        values = [params.get('value', '')]
+    if not isinstance(values, list):
+        raise RequestError(INVALID_PARAMS, '"values" must be a list')
+
+    precision = param_int(params, 'precision', PRECISION, 1)
+    quantize = param_int(params, 'quantize', QUANTIZE, 0)
+    scientific = param_int(params, 'scientific', SCIENTIFIC, 1)
+
+    # invalid values are null, the batch goes on
+    return [result for _, result in convert_values(
+        [str(v) for v in values], quantity, source, targets,
+        precision, quantize, scientific)]
+
+
+def param_quantity(params) -> str:
+    quantity = params.get('quantity')
+    if quantity not in quantities:
+        raise RequestError(INVALID_PARAMS, f'unknown quantity "{quantity}"')
+    return quantity
+
+
+def param_int(params, name: str, default: int, lower: int) -> int:
+    value = params.get(name, default)
+    if type(value) is not int or not lower <= value <= 1000:
+        raise RequestError(INVALID_PARAMS,
+                           f'"{name}" must be {lower}..1000')
+    return value
+
+
+def method_stats(params) -> dict:
+    return {'cache': conversion_cache.info()}
+
+
+methods = {
+    'quantities': method_quantities,
+    'units': method_units,
+    'convert': method_convert,
+    'stats': method_stats,
+}
+
+
+# ------------------------------------------------------------------------------
+
+
+def response_error(id, code: int, message: str) -> dict:
+    return {'jsonrpc': '2.0',
+            'id': id,
+            'error': {'code': code, 'message': message}}
+
+
+def dispatch(request) -> dict | None:
+    if not isinstance(request, dict) or request.get('jsonrpc') != '2.0':
+        return response_error(None, INVALID_REQUEST, 'invalid request')
+    # a notification gets no reply, not even an error
+    notification = 'id' not in request
+    id = request.get('id')
+    method = methods.get(request.get('method'))
+    if method is None:
+        if notification:
+            return None
+        return response_error(id, METHOD_NOT_FOUND, 'method not found')
+    params = request.get('params', {})
+    if not isinstance(params, dict):
+        if notification:
+            return None
+        return response_error(id, INVALID_PARAMS, 'params must be an object')
+    try:
+        result = method(params)
+    except RequestError as err:
+        response = response_error(id, err.code, str(err))
+    except Exception as err:
+        response = response_error(id, INTERNAL_ERROR, str(err))
+    else:
+        response = {'jsonrpc': '2.0', 'id': id, 'result': result}
+    return None if notification else response
+
+
+def handle_line(line: bytes) -> bytes | None:
+    try:
+        message = json.loads(line)
+    except ValueError:
+        response = response_error(None, PARSE_ERROR, 'parse error')
+    else:
+        if isinstance(message, list):  # batch
+            if not message:
+                response = response_error(None, INVALID_REQUEST,
+                                          'empty batch')
+            else:
+                response = [r for r in map(dispatch, message)
+                            if r is not None] or None
+        else:
+            response = dispatch(message)
+    if response is None:
+        return None
+    return json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+async def client(reader, writer):
+    # pipelined: requests are read while earlier responses are flushed,
+    # responses keep the order of the requests
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:  # longer than LIMIT
+                writer.write(handle_line(b''))
+                break
+            if not line:
+                break
+            if not line.strip():
+                continue
+            response = handle_line(line)
+            if response is not None:
+                writer.write(response)
+                if writer.transport.get_write_buffer_size() > LIMIT:
+                    await writer.drain()
+            await asyncio.sleep(0)  # other clients between requests
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+def remove_stale(path: str):
+    # a socket left by an instance that is gone, never a live one
+    # or anything else
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise RuntimeError(f'{path} exists and is not a socket')
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            os.unlink(path)
+            return
+    raise RuntimeError(f'another instance is listening on {path}')
+
+
+async def serve(path: str):
+    # owner only from the bind on
+    umask = os.umask(0o177)
+    try:
+        server = await asyncio.start_unix_server(client, path, limit=LIMIT)
+    finally:
+        os.umask(umask)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for s in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(s, stop.set)
+
+    print(f'Listening on {path}', file=sys.stderr)
+    async with server:
+        await stop.wait()
+    if os.path.exists(path):
+        os.unlink(path)
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog='convertidor --service',
+        description='Serve conversions as JSON-RPC 2.0 over a Unix socket.',
+    )
+    parser.add_argument('-s', '--socket', default=socket_path(),
+                        help='socket path (default: %(default)s)')
+    parser.add_argument('--cache-size', type=int,
+                        default=conversion_cache.size,
+                        help='results of repeated values to keep, 0 disables')
+    args = parser.parse_args(argv)
+
+    conversion_cache.resize(args.cache_size)
+    for error in load():
+        print('Warning: ' + error, file=sys.stderr)
+    warm_up(PRECISION)
+
+    try:
+        remove_stale(args.socket)
+    except (OSError, RuntimeError) as err:
+        print('Error: ' + str(err), file=sys.stderr)
+        return 1
+    asyncio.run(serve(args.socket))
+    return 0
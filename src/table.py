@@ -0,0 +1,68 @@
+# table.py
+#
+# Copyright 2025-2026 Golodnikov Sergey
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+# the conversion table as text, important: must not import gi
+
+import csv
+import io
+import json
+import os
+
+
+EXTENSIONS = {
+    'csv': '.csv',
+    'tsv': '.tsv',
+    'json': '.json',
+    'markdown': '.md',
+}
+
+
+def format_of(path: str, default: str = 'csv') -> str:
+    extension = os.path.splitext(path)[1].lower()
+    for name, e in EXTENSIONS.items():
+        if e == extension:
+            return name
+    return default
+
+
+def serialize(name: str, headers: list[str], rows: list[list[str]]) -> str:
+    # rows: the cells as displayed, the same number as the headers
+    match name:
+        case 'csv' | 'tsv':
+            out = io.StringIO()
+            writer = csv.writer(out,
+                                delimiter=',' if name == 'csv' else '\t',
+                                lineterminator='\n')
+            writer.writerow(headers)
+            writer.writerows(rows)
+            return out.getvalue()
+        case 'json':
+            return json.dumps([dict(zip(headers, row)) for row in rows],
+                              ensure_ascii=False) + '\n'
+        case 'markdown':
+            lines = [markdown_row(headers),
+                     '|' + '---|' * len(headers)]
+            lines.extend(map(markdown_row, rows))
+            return '\n'.join(lines) + '\n'
+    raise ValueError(f'unknown format: {name}')
+
+
+def markdown_row(cells) -> str:
+    return '| ' + ' | '.join(c.replace('|', '\\|') for c in cells) + ' |'
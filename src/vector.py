@@ -0,0 +1,155 @@
+# vector.py
+#
+# Copyright 2025-2026 Golodnikov Sergey
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+# float64 conversion of whole arrays, optional: requires NumPy
+
+from decimal import Decimal, localcontext
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .convertidor import conversion_matrix
+
+
+# quantities that are a plain ratio of units
+LINEAR = (
+    'angle',
+    'area',
+    'digital',
+    'energy',
+    'force',
+    'length',
+    'mass',
+    'power',
+    'pressure',
+    'speed',
+    'time',
+    'volume',
+)
+
+MAX_PRECISION = 15  # significant digits guaranteed by float64
+
+
+def available() -> bool:
+    return numpy is not None
+
+
+def supported(quantity: str, precision: int) -> bool:
+    return (numpy is not None and
+            quantity in LINEAR and
+            precision <= MAX_PRECISION)
+
+
+def ratios(quantity: str, index: int, precision: int):
+    row = conversion_matrix(quantity, precision)[index]
+    return numpy.array([float(r) for r in row], dtype=numpy.float64)
+
+
+def conversion_array(quantity: str, index: int, values, precision: int):
+    # rows: values, columns: units
+    values = numpy.asarray(values, dtype=numpy.float64)
+    # an overflow is inf, dropped by the caller as an invalid value
+    with numpy.errstate(over='ignore', invalid='ignore'):
+        return numpy.multiply.outer(values,
+                                    ratios(quantity, index, precision))
+
+
+def finite_rows(result):
+    return numpy.isfinite(result).all(axis=1).tolist()
+
+
+def deviation(quantity: str,
+              index: int,
+              values,
+              result,
+              precision: int,
+              targets: list[int]) -> float:
+    # maximum relative deviation from the Decimal reference,
+    # result: the columns of the targets
+    row = conversion_matrix(quantity, precision)[index]
+    row = [row[t] for t in targets]
+    worst = Decimal(0)
+    with localcontext() as context:
+        context.prec = precision
+        for value, converted in zip(values, result):
+            value = Decimal(repr(float(value)))
+            for ratio, fast in zip(row, converted):
+                reference = value * ratio
+                if reference == 0:
+                    continue
+                d = abs((Decimal(repr(float(fast))) - reference) / reference)
+                worst = max(worst, d)
+    return float(worst)
+
+
+def format_rows(result,
+                precision: int,
+                quantize: int,
+                scientific: int) -> list[list[str]]:
+    # the text of convertidor.format_value(): rounded to the quantum,
+    # without trailing zeros, E notation only for the exponents Decimal
+    # writes it with; one %g pass per block, only the cells %g may write
+    # differently from Decimal go through decimal_text()
+    result = numpy.round(result, quantize)
+    magnitude = numpy.abs(result)
+    with numpy.errstate(invalid='ignore'):
+        # %g exponents, integers close to the precision, and from the
+        # E notation threshold on the values %g may write as a round
+        # integer
+        tens = numpy.fmod(magnitude, 10)
+        odd = ((magnitude >= 10.0 ** (precision - 2)) |
+               ((magnitude < 1e-4) & (magnitude != 0)) |
+               ((magnitude >= 10.0 ** (scientific - 1)) &
+                (numpy.minimum(tens, 10 - tens) <=
+                 magnitude * 10.0 ** (1 - precision))))
+    rows, columns = result.shape
+    template = '\n'.join(['\t'.join([f'%.{precision}g'] * columns)] * rows)
+    text = template % tuple(result.ravel().tolist())
+    rows = [line.split('\t') for line in text.split('\n')]
+    for r, c in zip(*(i.tolist() for i in numpy.nonzero(odd))):
+        rows[r][c] = decimal_text(rows[r][c], scientific)
+    return rows
+
+
+def decimal_text(text: str, scientific: int) -> str:
+    # %g text as str() of the normalized Decimal
+    mantissa, e, exponent = text.partition('e')
+    sign = '-' if mantissa.startswith('-') else ''
+    if e:
+        exponent = int(exponent)
+        digits = mantissa.lstrip('-').replace('.', '')
+        if exponent < 0:
+            if exponent >= -6:
+                return f'{sign}0.{"0" * (-exponent - 1)}{digits}'
+            return f'{mantissa}E{exponent}'
+        if exponent + 1 < scientific:
+            return sign + digits.ljust(exponent + 1, '0')
+        return f'{mantissa}E+{exponent}'
+    if '.' not in text and text.endswith('0'):
+        digits = text.lstrip('-')
+        if digits != '0' and len(digits) >= scientific:
+            stripped = digits.rstrip('0')
+            mantissa = stripped[0]
+            if len(stripped) > 1:
+                mantissa += '.' + stripped[1:]
+            return f'{sign}{mantissa}E+{len(digits) - 1}'
+    return text
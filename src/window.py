@@ -22,7 +22,7 @@ from gettext import gettext as _
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Adw, Gtk
+from gi.repository import Adw, GObject, Gtk
 
 from .convertidor import quantities
 
@@ -32,17 +32,13 @@ class ConvertidorWindow(Adw.ApplicationWindow):
     __gtype_name__ = 'Convertidor'
 
     # structure
+    split_view = Gtk.Template.Child('split-view')
     quantities_list = Gtk.Template.Child('quantities-list')
+    sidebar_stack = Gtk.Template.Child('sidebar-stack')
+    search = Gtk.Template.Child('search')
+    search_results = Gtk.Template.Child('search-results')
 
-    label_cero = Gtk.Template.Child('label-cero')
-    label_uno = Gtk.Template.Child('label-uno')
-    label_dos = Gtk.Template.Child('label-dos')
-    label_tres = Gtk.Template.Child('label-tres')
-
-    units_cero = Gtk.Template.Child('units-cero')
-    units_uno = Gtk.Template.Child('units-uno')
-    units_dos = Gtk.Template.Child('units-dos')
-    units_tres = Gtk.Template.Child('units-tres')
+    units = Gtk.Template.Child('units')
 
     # preferences
     pref_dialog = Gtk.Template.Child('pref-dialog')
@@ -50,6 +46,7 @@ class ConvertidorWindow(Adw.ApplicationWindow):
     pref_precision = Gtk.Template.Child('pref-precision')
     pref_quantize = Gtk.Template.Child('pref-quantize')
     pref_scientific = Gtk.Template.Child('pref-scientific')
+    pref_exact = Gtk.Template.Child('pref-exact')
 
     # other
     overlay = Gtk.Template.Child('overlay')
@@ -57,19 +54,121 @@ class ConvertidorWindow(Adw.ApplicationWindow):
     show_imperial = Gtk.Template.Child('show-imperial')
     show_legacy = Gtk.Template.Child('show-legacy')
     button_reset = Gtk.Template.Child('button-reset')
+    profile = Gtk.Template.Child('profile')
 
     # strings to translate
     ts_src = _('Source')
     ts_reset = _('Values ​​have been reset')
     ts_copy = _('Value copied')
+    ts_table_copy = _('Table copied')
+    ts_table_export = _('Table exported')
     ts_comment = _('Convertidor is a handy and high precision application '
                    'for converting units of measurement.')
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # quantities
+    def quantities_populate(self):
+        # after the first frame, see ConvertidorApplication.populate()
         for q in quantities:
-            ar = Adw.ActionRow(name=q, title=quantities[q]['title'])
-            icon_name = 'q-' + q + '-symbolic'
-            ar.add_prefix(Gtk.Image.new_from_icon_name(icon_name))
+            ar = Adw.ActionRow(name=q, title=_(quantities.title(q)))
+            ar.add_prefix(Gtk.Image.new_from_icon_name(quantities.icon(q)))
             self.quantities_list.append(ar)
+
+
+class UnitItem(GObject.Object):
+    __gtype_name__ = 'ConvertidorUnitItem'
+
+    index = GObject.Property(type=int, default=0)
+    title = GObject.Property(type=str, default='')
+    hint = GObject.Property(type=str, default='')
+    section = GObject.Property(type=int, default=0)  # pattern
+    derived = GObject.Property(type=bool, default=False)
+    text = GObject.Property(type=str, default='')  # displayed value
+    error = GObject.Property(type=bool, default=False)
+    series = GObject.Property(type=str, default='')  # values, one per line
+
+
+class UnitRow(Gtk.Box):
+    __gtype_name__ = 'ConvertidorUnitRow'
+
+    # rows are recycled by the list view, see bind() and unbind()
+
+    def __init__(self):
+        super().__init__(orientation='horizontal', spacing=8)
+        self.set_margin_top(2)
+        self.set_margin_bottom(2)
+        self.set_margin_start(2)
+        self.set_margin_end(2)
+
+        self.item = None
+
+        self.label = Gtk.Label(halign='start', hexpand=True, wrap=True)
+        self.label.set_xalign(0)
+
+        self.hint = Gtk.Image.new_from_icon_name('hint-symbolic')
+        self.hint.add_css_class('hint-constant')
+
+        wrapper = Gtk.Box(valign='center')
+        wrapper.add_css_class('linked')
+
+        self.entry = Gtk.Entry(input_purpose='digits')
+        self.entry.set_size_request(260, -1)
+
+        self.increment = Gtk.Button(icon_name='plus-symbolic')
+        self.decrement = Gtk.Button(icon_name='minus-symbolic')
+        self.copy = Gtk.Button(icon_name='copy-symbolic')
+
+        wrapper.append(self.entry)
+        wrapper.append(self.increment)
+        wrapper.append(self.decrement)
+        wrapper.append(self.copy)
+
+        # a converted series, the text view lays out the visible lines
+        self.series = Gtk.TextView(editable=False,
+                                   cursor_visible=False,
+                                   monospace=True)
+        self.series_window = Gtk.ScrolledWindow(
+            child=self.series,
+            visible=False,
+            hscrollbar_policy=Gtk.PolicyType.NEVER,
+            max_content_height=160,
+            propagate_natural_height=True,
+        )
+        self.series_window.add_css_class('card')
+        self.series_text = ''
+
+        column = Gtk.Box(orientation='vertical', spacing=4, valign='center')
+        column.append(wrapper)
+        column.append(self.series_window)
+
+        self.append(self.label)
+        self.append(self.hint)
+        self.append(column)
+
+    def bind(self, item: UnitItem):
+        self.item = item
+        self.label.set_label(_(item.title))
+        if item.hint:
+            self.hint.set_tooltip_markup(_(item.hint))
+            self.hint.set_visible(True)
+        else:
+            self.hint.set_visible(False)
+        self.entry.set_name(str(item.index))
+        if self.entry.get_text() != item.text:
+            self.entry.set_text(item.text)
+        self.set_series(item.series)
+        self.set_error(item.error)
+
+    def unbind(self):
+        self.item = None
+
+    def set_series(self, text: str):
+        if text == self.series_text:
+            return  # bound again with the same column
+        self.series_text = text
+        self.series.get_buffer().set_text(text)
+        self.series_window.set_visible(bool(text))
+
+    def set_error(self, state: bool):
+        if state:
+            self.entry.add_css_class('css-error')
+        else:
+            self.entry.remove_css_class('css-error')
@@ -1,6 +1,6 @@
 #!/bin/bash
 
-xgettext -o po/convertidor.pot --files-from=po/POTFILES.in
+xgettext -o po/convertidor.pot --keyword=N_ --files-from=po/POTFILES.in
 
 msgmerge --update --backup='off' po/ru.po po/convertidor.pot
 